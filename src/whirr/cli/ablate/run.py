@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 from typing import TYPE_CHECKING, Optional, TypedDict, cast
 
 import typer
@@ -12,12 +11,14 @@ from rich.table import Table
 
 from whirr.ablate import get_ablations_dir, load_session_by_name
 from whirr.ablate.models import AblationRunResult
-from whirr.config import get_db_path, require_whirr_dir
+from whirr.config import get_db_path, get_project_dir, require_whirr_dir
 from whirr.db import create_job, get_connection
 from whirr.models.ablation import AblationSession, ConfigValue, FileValue
 from whirr.models.run import RunConfig
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from whirr.models.base import JSONValue
 
 console = Console()
@@ -249,7 +250,7 @@ def run(
         return
 
     # Submit jobs
-    workdir = str(Path.cwd())
+    workdir = str(get_project_dir())
 
     if server:
         _submit_remote(server, jobs_to_submit, workdir, session)
@@ -3,27 +3,29 @@
 from __future__ import annotations
 
 import csv
+import itertools
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Optional, Union, cast
 
 import typer
 from pydantic import TypeAdapter
 from rich.console import Console
 
 from whirr.config import get_db_path, require_whirr_dir
-from whirr.db import get_connection, get_runs
+from whirr.db import get_connection, iter_runs
 from whirr.models.base import JSONValue
 from whirr.run import read_meta, read_metrics
 
 if TYPE_CHECKING:
+    from whirr.models.db import RunRecord
     from whirr.models.run import RunMetricRecord
 
 console = Console()
 _JSON_OBJECT_ADAPTER = TypeAdapter(dict[str, JSONValue])
-_EXPORT_ADAPTER = TypeAdapter(list[dict[str, JSONValue]])
+CSVValue = Union[str, float, list[str], None]
 
 
-def _to_csv_value(value: JSONValue | None) -> str | float | list[str] | None:
+def _to_csv_value(value: JSONValue | None) -> CSVValue:
     if value is None:
         return None
     if isinstance(value, float):
@@ -35,6 +37,82 @@ def _to_csv_value(value: JSONValue | None) -> str | float | list[str] | None:
     return str(value)
 
 
+def _read_summary(run: RunRecord) -> dict[str, JSONValue]:
+    """Read summary metrics from meta.json, which is ahead of the DB for live runs."""
+    run_dir = Path(run.run_dir) if run.run_dir else None
+    if run_dir and run_dir.exists():
+        meta = read_meta(run_dir)
+        if meta and meta.summary:
+            return meta.summary.values
+    return {}
+
+
+def _build_run_data(
+    run: RunRecord,
+    include_metrics: bool,
+) -> dict[str, JSONValue]:
+    """Assemble the export record for a single run."""
+    tags_value = cast("JSONValue", run.tags) if run.tags is not None else None
+    run_data: dict[str, JSONValue] = {
+        "id": run.id,
+        "name": run.name,
+        "status": run.status,
+        "started_at": run.started_at,
+        "finished_at": run.finished_at,
+        "duration_s": run.duration_seconds,
+        "exit_code": None,
+        "tags": tags_value,
+        "run_dir": run.run_dir,
+    }
+
+    # Parse config
+    run_data["config"] = run.config.values if run.config else {}
+
+    run_data["summary"] = _read_summary(run)
+
+    run_dir = Path(run.run_dir) if run.run_dir else None
+    metrics_history: list[RunMetricRecord] = []
+    if include_metrics and run_dir:
+        metrics_path = run_dir / "metrics.jsonl"
+        if metrics_path.exists():
+            metrics_history = read_metrics(metrics_path)
+
+    if include_metrics:
+        metrics_payload = [
+            record.model_dump(by_alias=True, exclude_none=True)
+            for record in metrics_history
+        ]
+        run_data["metrics"] = cast("JSONValue", metrics_payload)
+
+    return run_data
+
+
+def _to_csv_row(run_data: dict[str, JSONValue]) -> dict[str, CSVValue]:
+    """Flatten an export record into a CSV row."""
+    row: dict[str, CSVValue] = {
+        "id": _to_csv_value(run_data.get("id")),
+        "name": _to_csv_value(run_data.get("name")),
+        "status": _to_csv_value(run_data.get("status")),
+        "started_at": _to_csv_value(run_data.get("started_at")),
+        "finished_at": _to_csv_value(run_data.get("finished_at")),
+        "duration_s": _to_csv_value(run_data.get("duration_s")),
+        "exit_code": _to_csv_value(run_data.get("exit_code")),
+        "tags": _to_csv_value(run_data.get("tags")),
+    }
+
+    # Flatten config
+    config_data = cast("dict[str, JSONValue]", run_data.get("config", {}))
+    for k, v in config_data.items():
+        row[f"config.{k}"] = _to_csv_value(v)
+
+    # Flatten summary
+    summary_data = cast("dict[str, JSONValue]", run_data.get("summary", {}))
+    for k, v in summary_data.items():
+        row[f"summary.{k}"] = _to_csv_value(v)
+
+    return row
+
+
 def export(
     output: Path = typer.Argument(
         cast("Path", cast("object", ...)), help="Output file path (.csv or .json)"
@@ -76,69 +154,42 @@ def export(
         include_metrics = False
 
     try:
-        # Fetch runs
-        all_runs = get_runs(conn, status=status, tag=tag, limit=limit)
+        # Stream runs from the database; no export holds more than one run
+        runs = iter_runs(
+            conn, status=status, tag=tag, limit=limit, id_prefix=run_id
+        )
+        first_run = next(runs, None)
 
-        # Filter by specific run ID if provided
-        if run_id:
-            all_runs = [r for r in all_runs if r.id.startswith(run_id)]
-            if not all_runs:
+        if first_run is None:
+            if run_id:
                 console.print(f"[red]Run not found: {run_id}[/red]")
                 raise typer.Exit(1)
-
-        if not all_runs:
             console.print("[yellow]No runs to export[/yellow]")
             raise typer.Exit(0)
 
-        # Build export data
-        export_data: list[dict[str, JSONValue]] = []
-        for run in all_runs:
-            tags_value = cast("JSONValue", run.tags) if run.tags is not None else None
-            run_data: dict[str, JSONValue] = {
-                "id": run.id,
-                "name": run.name,
-                "status": run.status,
-                "started_at": run.started_at,
-                "finished_at": run.finished_at,
-                "duration_s": run.duration_seconds,
-                "exit_code": None,
-                "tags": tags_value,
-                "run_dir": run.run_dir,
-            }
-
-            # Parse config
-            run_data["config"] = run.config.values if run.config else {}
-
-            # Get summary metrics from meta.json
-            run_dir = Path(run.run_dir) if run.run_dir else None
-            summary: dict[str, JSONValue] = {}
-            metrics_history: list[RunMetricRecord] = []
-
-            if run_dir and run_dir.exists():
-                meta = read_meta(run_dir)
-                if meta and meta.summary:
-                    summary = meta.summary.values
-
-                if include_metrics:
-                    metrics_path = run_dir / "metrics.jsonl"
-                    if metrics_path.exists():
-                        metrics_history = read_metrics(metrics_path)
-
-            run_data["summary"] = summary
-            if include_metrics:
-                metrics_payload = [
-                    record.model_dump(by_alias=True, exclude_none=True)
-                    for record in metrics_history
-                ]
-                run_data["metrics"] = cast("JSONValue", metrics_payload)
-
-            export_data.append(run_data)
+        exported = 0
 
         # Write output
         if suffix == ".json":
-            _ = output.write_bytes(_EXPORT_ADAPTER.dump_json(export_data, indent=2))
+            with output.open("wb") as f:
+                _ = f.write(b"[")
+                for run in itertools.chain([first_run], runs):
+                    run_data = _build_run_data(run, include_metrics)
+                    _ = f.write(b",\n" if exported else b"\n")
+                    _ = f.write(_JSON_OBJECT_ADAPTER.dump_json(run_data, indent=2))
+                    exported += 1
+                _ = f.write(b"\n]\n")
         else:
-            # CSV - flatten config and summary
+            # CSV - flatten config and summary. The header must name every
+            # key before the first row, so a first pass collects key names
+            # only and a second pass over a fresh cursor writes row by row.
+            config_keys: set[str] = set()
+            summary_keys: set[str] = set()
+            for run in itertools.chain([first_run], runs):
+                if run.config:
+                    config_keys.update(run.config.keys())
+                summary_keys.update(_read_summary(run))
+
             fieldnames = [
                 "id",
                 "name",
@@ -148,58 +199,23 @@ def export(
                 "duration_s",
                 "exit_code",
                 "tags",
+                *(f"config.{k}" for k in sorted(config_keys)),
+                *(f"summary.{k}" for k in sorted(summary_keys)),
             ]
 
-            # Collect all config and summary keys
-            config_keys: set[str] = set()
-            summary_keys: set[str] = set()
-            for run_data in export_data:
-                config_data = cast("dict[str, JSONValue]", run_data.get("config", {}))
-                config_keys.update(config_data.keys())
-                summary_data = cast("dict[str, JSONValue]", run_data.get("summary", {}))
-                summary_keys.update(summary_data.keys())
-
-            config_fields = [f"config.{k}" for k in sorted(config_keys)]
-            summary_fields = [f"summary.{k}" for k in sorted(summary_keys)]
-            fieldnames.extend(config_fields)
-            fieldnames.extend(summary_fields)
-
             with output.open("w", newline="") as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
                 writer.writeheader()
 
-                for run_data in export_data:
-                    row: dict[str, str | float | list[str] | None] = {
-                        "id": _to_csv_value(run_data.get("id")),
-                        "name": _to_csv_value(run_data.get("name")),
-                        "status": _to_csv_value(run_data.get("status")),
-                        "started_at": _to_csv_value(run_data.get("started_at")),
-                        "finished_at": _to_csv_value(run_data.get("finished_at")),
-                        "duration_s": _to_csv_value(run_data.get("duration_s")),
-                        "exit_code": _to_csv_value(run_data.get("exit_code")),
-                        "tags": _to_csv_value(run_data.get("tags")),
-                    }
-
-                    # Flatten config
-                    config_data = cast(
-                        "dict[str, JSONValue]",
-                        run_data.get("config", {}),
-                    )
-                    for k, v in config_data.items():
-                        row[f"config.{k}"] = _to_csv_value(v)
-
-                    # Flatten summary
-                    summary_data = cast(
-                        "dict[str, JSONValue]",
-                        run_data.get("summary", {}),
-                    )
-                    for k, v in summary_data.items():
-                        row[f"summary.{k}"] = _to_csv_value(v)
-
-                    writer.writerow(row)
+                for run in iter_runs(
+                    conn, status=status, tag=tag, limit=limit, id_prefix=run_id
+                ):
+                    run_data = _build_run_data(run, include_metrics=False)
+                    writer.writerow(_to_csv_row(run_data))
+                    exported += 1
 
         console.print(
-            f"[green]Exported {len(export_data)} run(s) to {output}[/green]"
+            f"[green]Exported {exported} run(s) to {output}[/green]"
         )
 
     finally:
@@ -7,6 +7,7 @@ import typer
 import yaml
 from rich.console import Console
 
+from whirr.config import get_project_dir
 from whirr.db import init_db
 
 console = Console()
@@ -22,7 +23,7 @@ def init(
 
     Creates a .whirr directory with configuration and database.
     """
-    target = path.resolve()
+    target = (get_project_dir() / path).resolve()
     whirr_dir = target / ".whirr"
 
     if whirr_dir.exists():
@@ -2,13 +2,12 @@
 """whirr submit command."""
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
 
-from whirr.config import get_db_path, require_whirr_dir
+from whirr.config import get_db_path, get_project_dir, require_whirr_dir
 from whirr.db import create_job, get_connection
 
 console = Console()
@@ -60,7 +59,7 @@ def submit(
         tag_list = [t.strip() for t in tags.split(",") if t.strip()]
 
     # Store absolute workdir at submission time
-    workdir = str(Path.cwd())
+    workdir = str(get_project_dir())
 
     if server:
         _submit_remote(server, command_argv, workdir, name, tag_list)
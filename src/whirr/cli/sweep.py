@@ -2,16 +2,18 @@
 """whirr sweep command."""
 from __future__ import annotations
 
-from pathlib import Path
+# Typer resolves the command's parameter annotations at runtime
+from pathlib import Path  # noqa: TC003
 from typing import Optional, cast
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from whirr.config import get_db_path, require_whirr_dir
-from whirr.db import create_job, get_connection
-from whirr.sweep import SweepConfig, generate_sweep_jobs
+from whirr.config import get_db_path, get_project_dir, require_whirr_dir
+from whirr.db import create_jobs_bulk, get_connection
+from whirr.models.api import JobCreate
+from whirr.sweep import SweepConfig, generate_sweep_jobs, sweep_size
 
 console = Console()
 
@@ -62,39 +64,58 @@ def sweep(
 
     # Generate jobs
     try:
+        job_count = sweep_size(sweep_config)
         jobs = generate_sweep_jobs(sweep_config, prefix)
     except ValueError as e:
         console.print(f"[red]Error generating jobs:[/red] {e}")
         raise typer.Exit(1) from e
 
-    if not jobs:
+    if job_count == 0:
         console.print("[yellow]No jobs generated from sweep config[/yellow]")
         return
 
-    # Display jobs
+    # Display jobs, collecting submission rows in the same pass
     table = Table(title=f"Sweep: {prefix or sweep_config.name or 'unnamed'}")
     table.add_column("#", style="dim")
     table.add_column("Name")
     table.add_column("Command")
     table.add_column("Parameters")
 
-    for i, job in enumerate(jobs):
-        # Format parameters
-        param_str = ", ".join(f"{k}={v}" for k, v in job.config.items())
-        # Truncate command if too long
-        cmd_str = " ".join(job.command)
-        if len(cmd_str) > 50:
-            cmd_str = cmd_str[:47] + "..."
-
-        table.add_row(
-            str(i),
-            job.name,
-            cmd_str,
-            param_str,
-        )
+    workdir = str(get_project_dir())
+    to_submit: list[JobCreate] = []
+
+    try:
+        for i, job in enumerate(jobs):
+            # Format parameters
+            param_str = ", ".join(f"{k}={v}" for k, v in job.config.items())
+            # Truncate command if too long
+            cmd_str = " ".join(job.command)
+            if len(cmd_str) > 50:
+                cmd_str = cmd_str[:47] + "..."
+
+            table.add_row(
+                str(i),
+                job.name,
+                cmd_str,
+                param_str,
+            )
+
+            if not dry_run:
+                to_submit.append(
+                    JobCreate(
+                        command_argv=job.command,
+                        workdir=workdir,
+                        name=job.name,
+                        tags=job.tags,
+                        config=job.config,
+                    )
+                )
+    except ValueError as e:
+        console.print(f"[red]Error generating jobs:[/red] {e}")
+        raise typer.Exit(1) from e
 
     console.print(table)
-    console.print(f"\n[bold]{len(jobs)} jobs[/bold] will be submitted")
+    console.print(f"\n[bold]{job_count} jobs[/bold] will be submitted")
 
     if dry_run:
         console.print("\n[yellow]Dry run - no jobs submitted[/yellow]")
@@ -102,21 +123,10 @@ def sweep(
 
     # Submit jobs
     db_path = get_db_path(whirr_dir)
-    workdir = str(Path.cwd())
 
     conn = get_connection(db_path)
     try:
-        submitted_ids: list[int] = []
-        for job in jobs:
-            job_id = create_job(
-                conn,
-                command_argv=job.command,
-                workdir=workdir,
-                name=job.name,
-                tags=job.tags,
-                config=job.config,
-            )
-            submitted_ids.append(job_id)
+        submitted_ids = create_jobs_bulk(conn, to_submit)
 
         console.print(f"\n[green]Submitted {len(submitted_ids)} jobs[/green]")
         console.print(f"  [dim]Job IDs:[/dim] {submitted_ids[0]}-{submitted_ids[-1]}")
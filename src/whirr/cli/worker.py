@@ -132,8 +132,9 @@ def _local_worker(gpu: int | None) -> None:
             )
             for job in orphaned:
                 job_name = job.name or "unnamed"
-                attempt = job.attempt + 1
-                console.print(f"  - Job #{job.id}: {job_name} (attempt {attempt})")
+                console.print(
+                    f"  - Job #{job.id}: {job_name} (attempt {job.attempt})"
+                )
     finally:
         conn.close()
 
@@ -17,6 +17,7 @@ from typing_extensions import Self
 from whirr.models.api import (
     ErrorResponse,
     HeartbeatResponse,
+    JobBulkCreateResponse,
     JobCancelResponse,
     JobClaimResponse,
     JobCreateResponse,
@@ -36,6 +37,7 @@ if TYPE_CHECKING:
     from collections.abc import Mapping
     from types import TracebackType
 
+    from whirr.models.api import JobCreate
     from whirr.models.base import JSONValue
     from whirr.models.run import ArtifactRecord, RunMetricRecord
 
@@ -398,6 +400,23 @@ class WhirrClient:
             response_model=JobCreateResponse,
         )
 
+    def submit_jobs(self, jobs: list[JobCreate]) -> JobBulkCreateResponse:
+        """Submit many jobs to the queue in one request.
+
+        Args:
+            jobs: Jobs to create, in submission order
+
+        Returns:
+            Created job IDs, in the same order as jobs
+
+        """
+        return self._request(
+            "POST",
+            "/api/v1/jobs/bulk",
+            json={"jobs": [job.model_dump() for job in jobs]},
+            response_model=JobBulkCreateResponse,
+        )
+
     def cancel_job(self, job_id: int) -> JobCancelResponse:
         """Cancel a job.
 
@@ -596,7 +615,7 @@ class WhirrClient:
             WhirrClientError: If job not found or server error
 
         """
-        start = time.time()
+        start = time.monotonic()
         while True:
             job = self.get_job(job_id)
             if job is None:
@@ -606,7 +625,7 @@ class WhirrClient:
             if job.status not in ("queued", "running"):
                 return job
 
-            if timeout is not None and (time.time() - start) > timeout:
+            if timeout is not None and (time.monotonic() - start) > timeout:
                 msg = f"Job {job_id} did not complete within {timeout}s"
                 raise TimeoutError(msg)
 
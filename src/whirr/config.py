@@ -2,12 +2,20 @@
 """Configuration management for whirr."""
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 import yaml
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Explicit project directory; None means "use the process cwd"
+_project_dir: ContextVar[Path | None] = ContextVar("whirr_project_dir", default=None)
+
 
 @dataclass
 class WhirrConfig:
@@ -26,13 +34,37 @@ class WhirrConfig:
     poll_interval: int = 5
 
 
+def get_project_dir() -> Path:
+    """Get the directory whirr treats as the project root.
+
+    This is the directory set by use_project_dir(), or the cwd otherwise.
+    """
+    project_dir = _project_dir.get()
+    return project_dir if project_dir is not None else Path.cwd()
+
+
+@contextmanager
+def use_project_dir(path: Path) -> Iterator[Path]:
+    """Resolve .whirr and git info from path instead of the cwd.
+
+    Unlike os.chdir(), this is scoped to the current context, so concurrent
+    threads or tasks can each work in their own project.
+    """
+    token = _project_dir.set(path)
+    try:
+        yield path
+    finally:
+        _project_dir.reset(token)
+
+
 def find_whirr_dir(start_path: Path | None = None) -> Path | None:
     """Find the nearest .whirr directory by walking up from start_path.
 
+    start_path defaults to get_project_dir().
     Returns None if no .whirr directory is found.
     """
     if start_path is None:
-        start_path = Path.cwd()
+        start_path = get_project_dir()
 
     current = start_path.resolve()
 
@@ -118,6 +118,21 @@ def get_runs_data(
             conn.close()
 
 
+def count_runs_data(status: str | None = None, limit: int = 100) -> int:
+    """Count runs (up to limit) from either local DB or remote server."""
+    if _is_remote_mode():
+        with _get_client() as client:
+            return len(client.get_runs(status=status, limit=limit))
+    else:
+        from whirr.db import count_runs
+
+        conn = _get_db()
+        try:
+            return count_runs(conn, status=status, limit=limit)
+        finally:
+            conn.close()
+
+
 def cancel_job_data(job_id: int) -> None:
     """Cancel a job via either local DB or remote server."""
     if _is_remote_mode():
@@ -204,7 +219,7 @@ async def dashboard(request: Request) -> HTMLResponse:
     # Calculate stats
     running_count = len([j for j in jobs if j.status == "running"])
     queued_count = len([j for j in jobs if j.status == "queued"])
-    completed_runs = get_runs_data(status="completed", limit=100)
+    completed_count = count_runs_data(status="completed", limit=100)
     workers_online = len([w for w in workers if w.status != "offline"])
 
     return templates.TemplateResponse(
@@ -217,7 +232,7 @@ async def dashboard(request: Request) -> HTMLResponse:
             "stats": {
                 "running": running_count,
                 "queued": queued_count,
-                "completed": len(completed_runs),
+                "completed": completed_count,
                 "workers_online": workers_online,
                 "workers_total": len(workers),
             },
@@ -389,7 +404,7 @@ async def stats_partial(request: Request) -> HTMLResponse:
     """Render the stats partial for HTMX polling."""
     jobs = get_active_jobs_data()
     workers = get_workers_data()
-    completed_runs = get_runs_data(status="completed", limit=100)
+    completed_count = count_runs_data(status="completed", limit=100)
 
     running_count = len([j for j in jobs if j.status == "running"])
     queued_count = len([j for j in jobs if j.status == "queued"])
@@ -402,7 +417,7 @@ async def stats_partial(request: Request) -> HTMLResponse:
             "stats": {
                 "running": running_count,
                 "queued": queued_count,
-                "completed": len(completed_runs),
+                "completed": completed_count,
                 "workers_online": workers_online,
                 "workers_total": len(workers),
             },
@@ -3,10 +3,12 @@
 
 from __future__ import annotations
 
+import os
 import socket
 import sqlite3
+import threading
 from abc import ABC, abstractmethod
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from contextlib import suppress
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Optional, Protocol, cast
@@ -21,9 +23,14 @@ from whirr.models.run import RunConfig, RunSummary
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from whirr.models.api import JobCreate
+
 JSONDict = dict[str, JSONValue]
 RowData = Mapping[str, object]
 _LIST_STR_ADAPTER = TypeAdapter(list[str])
+# Validates and serializes plain dicts straight from pydantic-core, without
+# building a RunConfig/RunSummary wrapper first (several times faster per row)
+_JSON_DICT_ADAPTER = TypeAdapter(JSONDict)
 
 
 def _dump_json_list(values: Sequence[str]) -> str:
@@ -33,19 +40,47 @@ def _dump_json_list(values: Sequence[str]) -> str:
 def _dump_run_config(config: JSONDict | RunConfig) -> str:
     if isinstance(config, RunConfig):
         return config.model_dump_json()
-    return RunConfig.model_validate(config).model_dump_json()
+    values = _JSON_DICT_ADAPTER.validate_python(config)
+    return _JSON_DICT_ADAPTER.dump_json(values).decode("utf-8")
 
 
 def _dump_run_summary(summary: JSONDict | RunSummary) -> str:
     if isinstance(summary, RunSummary):
         return summary.model_dump_json()
-    return RunSummary.model_validate(summary).model_dump_json()
+    values = _JSON_DICT_ADAPTER.validate_python(summary)
+    return _JSON_DICT_ADAPTER.dump_json(values).decode("utf-8")
 
 
 def _row_to_dict(row: sqlite3.Row | RowData) -> dict[str, object]:
     return dict(row)
 
 
+# Throughput tuning for write-heavy local use. Off by default because mmap and
+# relaxed syncing are unsafe on network filesystems; setting the
+# WHIRR_SQLITE_WAL environment variable to 1 turns it on.
+_SQLITE_TUNING_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _configure_sqlite(conn: sqlite3.Connection, *, in_memory: bool = False) -> None:
+    """Apply the connection pragmas shared by every SQLite connection.
+
+    In-memory databases have no journal file or fsyncs to tune, so they
+    only get the busy timeout.
+    """
+    _ = conn.execute("PRAGMA busy_timeout=5000")
+    if in_memory:
+        return
+    _ = conn.execute("PRAGMA journal_mode=WAL")
+    if os.environ.get("WHIRR_SQLITE_WAL") == "1":
+        for pragma in _SQLITE_TUNING_PRAGMAS:
+            _ = conn.execute(pragma)
+
+
 def _fetchone(cursor: sqlite3.Cursor) -> sqlite3.Row | None:
     return cast("Optional[sqlite3.Row]", cursor.fetchone())
 
@@ -189,6 +224,7 @@ CREATE TABLE IF NOT EXISTS workers (
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
 CREATE INDEX IF NOT EXISTS idx_jobs_heartbeat ON jobs(heartbeat_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_heartbeat ON jobs(status, heartbeat_at);
 CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs(lease_expires_at);
 CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status);
 CREATE INDEX IF NOT EXISTS idx_runs_job_id ON runs(job_id);
@@ -277,12 +313,49 @@ CREATE TABLE IF NOT EXISTS workers (
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
 CREATE INDEX IF NOT EXISTS idx_jobs_heartbeat ON jobs(heartbeat_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_heartbeat ON jobs(status, heartbeat_at);
 CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs(lease_expires_at);
 CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status);
 CREATE INDEX IF NOT EXISTS idx_runs_job_id ON runs(job_id);
 """
 
 
+# Requeue running jobs whose heartbeat is older than the cutoff in one
+# statement; RETURNING hands back the rows as they are after the requeue.
+_REQUEUE_STALE_SQLITE = """
+UPDATE jobs
+SET status = 'queued',
+    worker_id = NULL,
+    started_at = NULL,
+    heartbeat_at = NULL,
+    cancel_requested_at = NULL,
+    pid = NULL,
+    pgid = NULL,
+    attempt = attempt + 1
+WHERE status = 'running'
+  AND heartbeat_at IS NOT NULL
+  AND heartbeat_at < ?
+RETURNING *
+"""
+
+# Claim the oldest queued job. A single UPDATE is atomic under autocommit, so
+# no explicit transaction is needed around it.
+_CLAIM_JOB_SQLITE = """
+UPDATE jobs
+SET status = 'running',
+    worker_id = ?,
+    started_at = ?,
+    heartbeat_at = ?
+WHERE id = (
+    SELECT id FROM jobs
+    WHERE status = 'queued'
+    ORDER BY created_at, id
+    LIMIT 1
+)
+RETURNING *
+"""
+
+
 def utcnow() -> str:
     """Get current UTC time as ISO format string."""
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -322,6 +395,10 @@ class Database(ABC):
     ) -> int:
         """Create a new job and return its ID."""
 
+    @abstractmethod
+    def create_jobs(self, jobs: Sequence[JobCreate]) -> list[int]:
+        """Create many jobs in one transaction and return their IDs in order."""
+
     @abstractmethod
     def claim_job(self, worker_id: str, lease_seconds: int = 60) -> JobRecord | None:
         """Atomically claim the next queued job for a worker."""
@@ -370,7 +447,7 @@ class Database(ABC):
 
     @abstractmethod
     def requeue_expired_jobs(self) -> list[JobRecord]:
-        """Requeue jobs with expired leases."""
+        """Requeue jobs with expired leases and return them as requeued."""
 
     # --- Run Operations ---
 
@@ -437,6 +514,10 @@ class Database(ABC):
     def unregister_worker(self, worker_id: str) -> None:
         """Mark worker as offline on graceful shutdown."""
 
+    @abstractmethod
+    def get_worker(self, worker_id: str) -> WorkerRecord | None:
+        """Get a worker by ID."""
+
     @abstractmethod
     def get_workers(self) -> list[WorkerRecord]:
         """Get all registered workers."""
@@ -445,24 +526,61 @@ class Database(ABC):
 class SQLiteDatabase(Database):
     """SQLite database implementation for local mode."""
 
-    db_path: Path
+    db_path: Path | str
     conn: sqlite3.Connection
+    _in_memory: bool
+    _local: threading.local
+    _readers: list[sqlite3.Connection]
+    _readers_lock: threading.Lock
 
-    def __init__(self, db_path: Path) -> None:
-        """Initialize a SQLite database connection."""
+    def __init__(self, db_path: Path | str) -> None:
+        """Initialize a SQLite database connection.
+
+        Pass ":memory:" for a private in-memory database.
+        """
         self.db_path = db_path
-        self.conn = sqlite3.connect(
-            str(db_path),
+        self._in_memory = str(db_path) == ":memory:"
+        self.conn = self._connect()
+        self._local = threading.local()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path),
             timeout=5.0,
             isolation_level=None,
             check_same_thread=False,  # Allow use across threads (for FastAPI)
         )
-        _ = self.conn.execute("PRAGMA journal_mode=WAL")
-        _ = self.conn.execute("PRAGMA busy_timeout=5000")
-        self.conn.row_factory = sqlite3.Row
+        _configure_sqlite(conn, in_memory=self._in_memory)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Get this thread's read-only connection.
+
+        Under WAL, readers on their own connections don't wait for the writer
+        or for each other, so each thread reads through a query_only
+        connection instead of queueing on self.conn. An in-memory database
+        only exists on self.conn, so it reads there.
+        """
+        if self._in_memory:
+            return self.conn
+        conn = cast("sqlite3.Connection | None", getattr(self._local, "conn", None))
+        if conn is None:
+            conn = self._connect()
+            _ = conn.execute("PRAGMA query_only=1")
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
 
     @override
     def close(self) -> None:
+        with self._readers_lock:
+            for reader in self._readers:
+                reader.close()
+            self._readers.clear()
         self.conn.close()
 
     def init_schema(self) -> None:
@@ -514,40 +632,14 @@ class SQLiteDatabase(Database):
         return cursor.lastrowid
 
     @override
-    def claim_job(self, worker_id: str, lease_seconds: int = 60) -> JobRecord | None:
-        try:
-            _ = self.conn.execute("BEGIN IMMEDIATE")
-            now = utcnow()
-            cursor = self.conn.execute(
-                """
-                UPDATE jobs
-                SET status = 'running',
-                    worker_id = ?,
-                    started_at = ?,
-                    heartbeat_at = ?
-                WHERE id = (
-                    SELECT id FROM jobs
-                    WHERE status = 'queued'
-                    ORDER BY created_at, id
-                    LIMIT 1
-                )
-                RETURNING id, name, command_argv, workdir, config, tags, attempt
-                """,
-                (worker_id, now, now),
-            )
-            row = _fetchone(cursor)
-            _ = self.conn.execute("COMMIT")
+    def create_jobs(self, jobs: Sequence[JobCreate]) -> list[int]:
+        return create_jobs_bulk(self.conn, jobs)
 
-            if row is None:
-                return None
-
-            job_data = _row_to_dict(row)
-            job_data["status"] = "running"
-            job_data["worker_id"] = worker_id
-            return JobRecord.model_validate(job_data)
-        except sqlite3.Error:
-            _ = self.conn.execute("ROLLBACK")
-            raise
+    @override
+    def claim_job(self, worker_id: str, lease_seconds: int = 60) -> JobRecord | None:
+        now = utcnow()
+        row = _fetchone(self.conn.execute(_CLAIM_JOB_SQLITE, (worker_id, now, now)))
+        return self._deserialize_job(row) if row is not None else None
 
     @override
     def renew_lease(self, job_id: int, worker_id: str, lease_seconds: int = 60) -> bool:
@@ -637,7 +729,7 @@ class SQLiteDatabase(Database):
 
     @override
     def get_job(self, job_id: int) -> JobRecord | None:
-        cursor = self.conn.execute(
+        cursor = self._reader().execute(
             "SELECT * FROM jobs WHERE id = ?",
             (job_id,),
         )
@@ -648,7 +740,7 @@ class SQLiteDatabase(Database):
 
     @override
     def get_active_jobs(self) -> list[JobRecord]:
-        cursor = self.conn.execute(
+        cursor = self._reader().execute(
             """
             SELECT * FROM jobs
             WHERE status IN ('queued', 'running')
@@ -678,7 +770,7 @@ class SQLiteDatabase(Database):
         cutoff_dt = now - timedelta(seconds=120)
         cutoff = cutoff_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        cursor = self.conn.execute(
+        cursor = self._reader().execute(
             """
             SELECT * FROM jobs
             WHERE status = 'running'
@@ -692,24 +784,13 @@ class SQLiteDatabase(Database):
 
     @override
     def requeue_expired_jobs(self) -> list[JobRecord]:
-        expired = self.get_expired_leases()
-        for job in expired:
-            _ = self.conn.execute(
-                """
-                UPDATE jobs
-                SET status = 'queued',
-                    worker_id = NULL,
-                    started_at = NULL,
-                    heartbeat_at = NULL,
-                    cancel_requested_at = NULL,
-                    pid = NULL,
-                    pgid = NULL,
-                    attempt = attempt + 1
-                WHERE id = ?
-                """,
-                (job.id,),
-            )
-        return expired
+        now = datetime.now(timezone.utc)
+        cutoff_dt = now - timedelta(seconds=120)
+        cutoff = cutoff_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        cursor = self.conn.execute(_REQUEUE_STALE_SQLITE, (cutoff,))
+        rows = _fetchall(cursor)
+        return [JobRecord.model_validate(_row_to_dict(row)) for row in rows]
 
     # --- Run Operations ---
 
@@ -778,7 +859,7 @@ class SQLiteDatabase(Database):
 
     @override
     def get_run(self, run_id: str) -> RunRecord | None:
-        cursor = self.conn.execute(
+        cursor = self._reader().execute(
             "SELECT * FROM runs WHERE id = ?",
             (run_id,),
         )
@@ -808,7 +889,7 @@ class SQLiteDatabase(Database):
         query += " ORDER BY started_at DESC LIMIT ?"
         params.append(limit)
 
-        cursor = self.conn.execute(query, params)
+        cursor = self._reader().execute(query, params)
         rows = _fetchall(cursor)
         return [
             RunRecord.model_validate(_row_to_dict(row))
@@ -817,7 +898,7 @@ class SQLiteDatabase(Database):
 
     @override
     def get_run_by_job_id(self, job_id: int) -> RunRecord | None:
-        cursor = self.conn.execute(
+        cursor = self._reader().execute(
             "SELECT * FROM runs WHERE job_id = ?",
             (job_id,),
         )
@@ -888,9 +969,20 @@ class SQLiteDatabase(Database):
             (worker_id,),
         )
 
+    @override
+    def get_worker(self, worker_id: str) -> WorkerRecord | None:
+        cursor = self._reader().execute(
+            "SELECT * FROM workers WHERE id = ?",
+            (worker_id,),
+        )
+        row = _fetchone(cursor)
+        if row is None:
+            return None
+        return WorkerRecord.model_validate(_row_to_dict(row))
+
     @override
     def get_workers(self) -> list[WorkerRecord]:
-        cursor = self.conn.execute("SELECT * FROM workers ORDER BY id")
+        cursor = self._reader().execute("SELECT * FROM workers ORDER BY id")
         rows = _fetchall(cursor)
         return [WorkerRecord.model_validate(_row_to_dict(row)) for row in rows]
 
@@ -984,6 +1076,41 @@ class PostgresDatabase(Database):
         self.conn.commit()
         return job_id
 
+    def _insert_job(self, job: JobCreate) -> int:
+        """Insert one job without committing and return its ID."""
+        cur = self._execute(
+            """
+            INSERT INTO jobs (
+                name, command_argv, workdir, config, tags, attempt
+            )
+            VALUES (%s, %s, %s, %s, %s, 1)
+            RETURNING id
+            """,
+            (
+                job.name,
+                _dump_json_list(job.command_argv),
+                job.workdir,
+                _dump_run_config(job.config) if job.config else None,
+                _dump_json_list(job.tags) if job.tags else None,
+            ),
+        )
+        row = cur.fetchone()
+        if row is None:
+            msg = "Failed to create jobs"
+            raise RuntimeError(msg)
+        return cast("int", row["id"])
+
+    @override
+    def create_jobs(self, jobs: Sequence[JobCreate]) -> list[int]:
+        try:
+            job_ids = [self._insert_job(job) for job in jobs]
+        except Exception:
+            self.conn.rollback()
+            raise
+        # One commit for the whole batch
+        self.conn.commit()
+        return job_ids
+
     @override
     def claim_job(self, worker_id: str, lease_seconds: int = 60) -> JobRecord | None:
         """Atomically claim a job using FOR UPDATE SKIP LOCKED."""
@@ -1168,26 +1295,29 @@ class PostgresDatabase(Database):
     @override
     def requeue_expired_jobs(self) -> list[JobRecord]:
         """Requeue jobs with expired leases."""
-        expired = self.get_expired_leases()
-        for job in expired:
-            _ = self._execute(
-                """
-                UPDATE jobs
-                SET status = 'queued',
-                    worker_id = NULL,
-                    started_at = NULL,
-                    heartbeat_at = NULL,
-                    lease_expires_at = NULL,
-                    cancel_requested_at = NULL,
-                    pid = NULL,
-                    pgid = NULL,
-                    attempt = attempt + 1
-                WHERE id = %s
-                """,
-                (job.id,),
-            )
+        cur = self._execute(
+            """
+            UPDATE jobs
+            SET status = 'queued',
+                worker_id = NULL,
+                started_at = NULL,
+                heartbeat_at = NULL,
+                lease_expires_at = NULL,
+                cancel_requested_at = NULL,
+                pid = NULL,
+                pgid = NULL,
+                attempt = attempt + 1
+            WHERE status = 'running'
+              AND lease_expires_at IS NOT NULL
+              AND lease_expires_at < NOW()
+            RETURNING *
+            """
+        )
+        requeued = [
+            JobRecord.model_validate(_row_to_dict(row)) for row in cur.fetchall()
+        ]
         self.conn.commit()
-        return expired
+        return requeued
 
     # --- Run Operations ---
 
@@ -1361,6 +1491,14 @@ class PostgresDatabase(Database):
         )
         self.conn.commit()
 
+    @override
+    def get_worker(self, worker_id: str) -> WorkerRecord | None:
+        cur = self._execute("SELECT * FROM workers WHERE id = %s", (worker_id,))
+        row = cur.fetchone()
+        if row is None:
+            return None
+        return WorkerRecord.model_validate(_row_to_dict(row))
+
     @override
     def get_workers(self) -> list[WorkerRecord]:
         cur = self._execute("SELECT * FROM workers ORDER BY id")
@@ -1407,8 +1545,7 @@ def get_connection(db_path: Path) -> sqlite3.Connection:
     DEPRECATED: Use SQLiteDatabase class instead.
     """
     conn = sqlite3.connect(str(db_path), timeout=5.0, isolation_level=None)
-    _ = conn.execute("PRAGMA journal_mode=WAL")
-    _ = conn.execute("PRAGMA busy_timeout=5000")
+    _configure_sqlite(conn)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -1462,45 +1599,67 @@ def create_job(  # noqa: PLR0913
     return cursor.lastrowid
 
 
-def claim_job(conn: sqlite3.Connection, worker_id: str) -> JobRecord | None:
-    """Atomically claim the next queued job.
+def create_jobs_bulk(
+    conn: sqlite3.Connection,
+    jobs: Iterable[JobCreate],
+) -> list[int]:
+    """Create many jobs in a single transaction and return their IDs.
 
-    DEPRECATED: Use Database.claim_job() instead.
+    All rows are serialized up front and written with one executemany, so a
+    sweep of N jobs costs one commit instead of N. If the caller already has a
+    transaction open, the rows join it and committing is left to the caller.
     """
+    rows = [
+        (
+            job.name,
+            _dump_json_list(job.command_argv),
+            job.workdir,
+            _dump_run_config(job.config) if job.config else None,
+            _dump_json_list(job.tags) if job.tags else None,
+            1,
+        )
+        for job in jobs
+    ]
+    if not rows:
+        return []
+
+    # Join a transaction the caller already holds; only ours is ended here
+    owns_transaction = not conn.in_transaction
     try:
-        _ = conn.execute("BEGIN IMMEDIATE")
-        now = utcnow()
-        cursor = conn.execute(
+        if owns_transaction:
+            _ = conn.execute("BEGIN IMMEDIATE")
+        _ = conn.executemany(
             """
-            UPDATE jobs
-            SET status = 'running',
-                worker_id = ?,
-                started_at = ?,
-                heartbeat_at = ?
-            WHERE id = (
-                SELECT id FROM jobs
-                WHERE status = 'queued'
-                ORDER BY created_at, id
-                LIMIT 1
-            )
-            RETURNING id, name, command_argv, workdir, config, tags, attempt
+            INSERT INTO jobs (name, command_argv, workdir, config, tags, attempt)
+            VALUES (?, ?, ?, ?, ?, ?)
             """,
-            (worker_id, now, now),
+            rows,
         )
-        row = _fetchone(cursor)
-        _ = conn.execute("COMMIT")
-
-        if row is None:
-            return None
-
-        job_data = _row_to_dict(row)
-        job_data["status"] = "running"
-        job_data["worker_id"] = worker_id
-        return JobRecord.model_validate(job_data)
+        row = _fetchone(conn.execute("SELECT last_insert_rowid()"))
+        if owns_transaction:
+            _ = conn.execute("COMMIT")
     except sqlite3.Error:
-        _ = conn.execute("ROLLBACK")
+        if owns_transaction and conn.in_transaction:
+            _ = conn.execute("ROLLBACK")
         raise
 
+    if row is None:
+        msg = "Failed to create jobs"
+        raise RuntimeError(msg)
+    # IDs are contiguous: AUTOINCREMENT under a write lock held for the batch
+    last_id = cast("int", row[0])
+    return list(range(last_id - len(rows) + 1, last_id + 1))
+
+
+def claim_job(conn: sqlite3.Connection, worker_id: str) -> JobRecord | None:
+    """Atomically claim the next queued job.
+
+    DEPRECATED: Use Database.claim_job() instead.
+    """
+    now = utcnow()
+    row = _fetchone(conn.execute(_CLAIM_JOB_SQLITE, (worker_id, now, now)))
+    return JobRecord.model_validate(_row_to_dict(row)) if row is not None else None
+
 
 def update_job_process_info(
     conn: sqlite3.Connection,
@@ -1657,28 +1816,17 @@ def requeue_orphaned_jobs(
     conn: sqlite3.Connection,
     timeout_seconds: int = 120,
 ) -> list[JobRecord]:
-    """Requeue orphaned jobs.
+    """Requeue orphaned jobs and return them as requeued.
 
     DEPRECATED: Use Database.requeue_expired_jobs() instead.
     """
-    orphaned = get_orphaned_jobs(conn, timeout_seconds)
-    for job in orphaned:
-        _ = conn.execute(
-            """
-            UPDATE jobs
-            SET status = 'queued',
-                worker_id = NULL,
-                started_at = NULL,
-                heartbeat_at = NULL,
-                cancel_requested_at = NULL,
-                pid = NULL,
-                pgid = NULL,
-                attempt = attempt + 1
-            WHERE id = ?
-            """,
-            (job.id,),
-        )
-    return orphaned
+    now = datetime.now(timezone.utc)
+    cutoff_dt = now - timedelta(seconds=timeout_seconds)
+    cutoff = cutoff_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    cursor = conn.execute(_REQUEUE_STALE_SQLITE, (cutoff,))
+    rows = _fetchall(cursor)
+    return [JobRecord.model_validate(_row_to_dict(row)) for row in rows]
 
 
 def retry_job(conn: sqlite3.Connection, job_id: int) -> int:
@@ -1835,6 +1983,78 @@ def get_runs(
     ]
 
 
+def _runs_filter(
+    status: str | None,
+    tag: str | None,
+    id_prefix: str | None,
+) -> tuple[str, list[object]]:
+    """Build the WHERE clause shared by the streaming run queries."""
+    clause = " WHERE 1=1"
+    params: list[object] = []
+
+    if status:
+        clause += " AND status = ?"
+        params.append(status)
+
+    if tag:
+        clause += " AND tags LIKE ?"
+        params.append(f'%"{tag}"%')
+
+    if id_prefix:
+        escaped = (
+            id_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        clause += " AND id LIKE ? ESCAPE '\\'"
+        params.append(f"{escaped}%")
+
+    return clause, params
+
+
+def count_runs(
+    conn: sqlite3.Connection,
+    status: str | None = None,
+    tag: str | None = None,
+    limit: int | None = None,
+) -> int:
+    """Count runs matching the filters, stopping early at limit if given."""
+    where, params = _runs_filter(status, tag, None)
+    query = "SELECT COUNT(*) FROM (SELECT 1 FROM runs"
+    query += where
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+    query += ")"
+
+    row = _fetchone(conn.execute(query, params))
+    return cast("int", row[0]) if row is not None else 0
+
+
+def iter_runs(  # noqa: PLR0913
+    conn: sqlite3.Connection,
+    *,
+    status: str | None = None,
+    tag: str | None = None,
+    limit: int = 50,
+    id_prefix: str | None = None,
+    batch_size: int = 1000,
+) -> Iterator[RunRecord]:
+    """Stream runs newest first, fetching rows from the cursor in batches.
+
+    Unlike get_runs(), the full result set is never held in memory.
+    """
+    where, params = _runs_filter(status, tag, id_prefix)
+    query = "SELECT * FROM runs"
+    query += where
+    query += " ORDER BY started_at DESC LIMIT ?"
+    cursor = conn.execute(query, [*params, limit])
+    while True:
+        rows = cast("list[sqlite3.Row]", cursor.fetchmany(batch_size))
+        if not rows:
+            return
+        for row in rows:
+            yield RunRecord.model_validate(_row_to_dict(row))
+
+
 def get_run_by_job_id(conn: sqlite3.Connection, job_id: int) -> RunRecord | None:
     """Get run by job ID.
 
@@ -12,6 +12,8 @@ from .api import (
     ErrorResponse,
     HealthResponse,
     HeartbeatResponse,
+    JobBulkCreate,
+    JobBulkCreateResponse,
     JobCancelResponse,
     JobClaim,
     JobClaimResponse,
@@ -55,6 +57,8 @@ __all__ = [
     "GitInfo",
     "HealthResponse",
     "HeartbeatResponse",
+    "JobBulkCreate",
+    "JobBulkCreateResponse",
     "JobCancelResponse",
     "JobClaim",
     "JobClaimResponse",
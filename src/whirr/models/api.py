@@ -61,6 +61,19 @@ class JobCreateResponse(WhirrBaseModel):
     message: str
 
 
+class JobBulkCreate(WhirrBaseModel):
+    """Request to create many jobs at once."""
+
+    jobs: list[JobCreate]
+
+
+class JobBulkCreateResponse(WhirrBaseModel):
+    """Response from creating many jobs."""
+
+    job_ids: list[int]
+    message: str
+
+
 class JobClaim(WhirrBaseModel):
     """Request to claim a job."""
 
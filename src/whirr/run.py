@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import atexit
+import functools
 import os
 import shutil
 import subprocess
@@ -16,7 +17,7 @@ from typing import TYPE_CHECKING, Protocol
 from pydantic import ValidationError
 from typing_extensions import Self
 
-from whirr.config import find_whirr_dir, get_db_path, get_runs_dir
+from whirr.config import find_whirr_dir, get_db_path, get_project_dir, get_runs_dir
 from whirr.db import complete_run, create_run, get_connection
 from whirr.models.run import GitInfo, RunConfig, RunMeta, RunMetricRecord, RunSummary
 
@@ -43,6 +44,7 @@ def _run_command(
     argv: list[str],
     *,
     timeout: float,
+    cwd: Path | None = None,
 ) -> subprocess.CompletedProcess[str] | None:
     cmd_path = shutil.which(argv[0])
     if cmd_path is None:
@@ -54,82 +56,98 @@ def _run_command(
             text=True,
             timeout=timeout,
             check=False,
+            cwd=cwd,
         )
     except (OSError, subprocess.TimeoutExpired):
         return None
 
 
-def _capture_git_info() -> GitInfo | None:
-    """Capture git repository information."""
-    # Check if we're in a git repo
-    result = _run_command(
-        ["git", "rev-parse", "--is-inside-work-tree"],
+@functools.lru_cache(maxsize=8)
+def _git_remote_cached(cwd: str) -> str | None:
+    """Look up the origin remote URL once per working directory."""
+    remote_result = _run_command(
+        ["git", "remote", "get-url", "origin"],
         timeout=5,
+        cwd=Path(cwd),
     )
-    if result is None or result.returncode != 0:
+    if remote_result is None or remote_result.returncode != 0:
         return None
+    return remote_result.stdout.strip()
 
-    # Get commit hash
-    commit_result = _run_command(["git", "rev-parse", "HEAD"], timeout=5)
-    if commit_result is None:
-        return None
-    commit = commit_result.stdout.strip()
 
-    # Get short hash
-    short_hash_result = _run_command(["git", "rev-parse", "--short", "HEAD"], timeout=5)
-    if short_hash_result is None:
-        return None
-    short_hash = short_hash_result.stdout.strip()
+def _capture_git_info(cwd: Path | None = None) -> GitInfo | None:
+    """Capture git repository information for cwd (default: project dir).
 
-    # Check if dirty (uncommitted changes)
-    dirty_result = _run_command(["git", "status", "--porcelain"], timeout=5)
-    if dirty_result is None:
-        return None
-    is_dirty = bool(dirty_result.stdout.strip())
-
-    # Get branch name
-    branch_result = _run_command(
-        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+    A single ``git status --porcelain=v2 --branch`` reports the commit,
+    branch, and dirty state together; it fails outside a work tree. The
+    remote URL rarely changes and is cached per working directory.
+    """
+    if cwd is None:
+        cwd = get_project_dir()
+    result = _run_command(
+        ["git", "status", "--porcelain=v2", "--branch"],
         timeout=5,
+        cwd=cwd,
     )
-    if branch_result is None:
+    if result is None or result.returncode != 0:
         return None
-    branch = branch_result.stdout.strip()
 
-    # Get remote URL (if any)
-    remote_result = _run_command(
-        ["git", "remote", "get-url", "origin"],
-        timeout=5,
-    )
-    remote = (
-        remote_result.stdout.strip()
-        if remote_result is not None and remote_result.returncode == 0
-        else None
-    )
+    commit: str | None = None
+    branch: str | None = None
+    is_dirty = False
+    for line in result.stdout.splitlines():
+        if line.startswith("# branch.oid "):
+            commit = line[len("# branch.oid "):].strip()
+        elif line.startswith("# branch.head "):
+            branch = line[len("# branch.head "):].strip()
+        elif line and not line.startswith("#"):
+            # Any changed, unmerged, or untracked entry
+            is_dirty = True
+
+    # No commits yet, nothing to record
+    if commit is None or commit == "(initial)":
+        return None
 
     return GitInfo(
         commit=commit,
-        short_hash=short_hash,
-        branch=branch,
+        short_hash=commit[:7],
+        # Match `git rev-parse --abbrev-ref HEAD` for detached checkouts
+        branch="HEAD" if branch in (None, "(detached)") else branch,
         dirty=is_dirty,
-        remote=remote,
+        remote=_git_remote_cached(str(cwd)),
     )
 
 
-def _capture_pip_freeze() -> list[str] | None:
-    """Capture installed packages via pip freeze."""
-    result = _run_command(["pip", "freeze"], timeout=30)
-    if result is not None and result.returncode == 0:
-        return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+@functools.lru_cache(maxsize=8)
+def _pip_freeze_cached(python: str, pip: str | None) -> tuple[str, ...] | None:
+    """Run pip freeze once per interpreter/pip pair."""
+    if pip is not None:
+        result = _run_command([pip, "freeze"], timeout=30)
+        if result is not None and result.returncode == 0:
+            return tuple(
+                line.strip() for line in result.stdout.splitlines() if line.strip()
+            )
 
     # Try python -m pip as fallback
-    result = _run_command([sys.executable, "-m", "pip", "freeze"], timeout=30)
+    result = _run_command([python, "-m", "pip", "freeze"], timeout=30)
     if result is not None and result.returncode == 0:
-        return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+        return tuple(
+            line.strip() for line in result.stdout.splitlines() if line.strip()
+        )
 
     return None
 
 
+def _capture_pip_freeze() -> list[str] | None:
+    """Capture installed packages via pip freeze.
+
+    The result is cached for the lifetime of the process, since installed
+    packages rarely change while experiments are running.
+    """
+    packages = _pip_freeze_cached(sys.executable, shutil.which("pip"))
+    return list(packages) if packages is not None else None
+
+
 class Run:
     """A whirr experiment run.
 
@@ -155,6 +173,7 @@ class Run:
     _metrics_path: Path
     _meta_path: Path
     _config_path: Path
+    _whirr_dir: Path | None
     git_info: GitInfo | None
     pip_packages: list[str] | None
 
@@ -170,10 +189,13 @@ class Run:
         system_metrics_interval: float = 10.0,
         capture_git: bool = True,  # noqa: FBT001, FBT002
         capture_pip: bool = True,  # noqa: FBT001, FBT002
+        project_dir: Path | None = None,
     ) -> None:
         """Initialize a run.
 
         In most cases, use whirr.init() instead of constructing directly.
+        project_dir defaults to get_project_dir() and is used to find
+        .whirr and capture git info.
         """
         self._finished = False
         self._metric_idx = 0
@@ -181,6 +203,7 @@ class Run:
         self._system_metrics_collector = None
         self._finished_at = None
         self._status = "running"
+        self._whirr_dir = find_whirr_dir(project_dir)
 
         # Detect worker context
         env_job_id = os.environ.get("WHIRR_JOB_ID")
@@ -201,7 +224,7 @@ class Run:
             if run_dir:
                 self.run_dir = run_dir
             else:
-                runs_dir = get_runs_dir()
+                runs_dir = get_runs_dir(self._whirr_dir)
                 self.run_dir = runs_dir / self.run_id
 
         # Store metadata
@@ -226,7 +249,7 @@ class Run:
         # Capture git info
         self.git_info = None
         if capture_git:
-            self.git_info = _capture_git_info()
+            self.git_info = _capture_git_info(project_dir)
             if self.git_info:
                 git_path = self.run_dir / "git.json"
                 _ = git_path.write_text(self.git_info.model_dump_json(indent=2))
@@ -244,9 +267,8 @@ class Run:
         self._write_meta()
 
         # Register with database if we have a whirr context
-        whirr_dir = find_whirr_dir()
-        if whirr_dir:
-            db_path = get_db_path(whirr_dir)
+        if self._whirr_dir:
+            db_path = get_db_path(self._whirr_dir)
             conn = get_connection(db_path)
             try:
                 create_run(
@@ -294,7 +316,10 @@ class Run:
             pip_packages_count=len(self.pip_packages) if self.pip_packages else None,
         )
 
-        _ = self._meta_path.write_text(meta.model_dump_json(indent=2))
+        # Write-then-rename so concurrent readers never see a partial file
+        tmp_path = self._meta_path.with_suffix(".json.tmp")
+        _ = tmp_path.write_text(meta.model_dump_json(indent=2))
+        _ = tmp_path.replace(self._meta_path)
 
     def log(
         self,
@@ -393,9 +418,8 @@ class Run:
         self._write_meta()
 
         # Update database
-        whirr_dir = find_whirr_dir()
-        if whirr_dir:
-            db_path = get_db_path(whirr_dir)
+        if self._whirr_dir:
+            db_path = get_db_path(self._whirr_dir)
             conn = get_connection(db_path)
             try:
                 complete_run(
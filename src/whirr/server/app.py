@@ -8,11 +8,10 @@ import logging
 import mimetypes
 import os
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from threading import Thread
-from time import sleep
+from threading import Event, Thread
 from typing import TYPE_CHECKING, Annotated, Optional, cast
 
 from fastapi import Depends, FastAPI, HTTPException, Query
@@ -22,6 +21,8 @@ from whirr.db import Database, PostgresDatabase, SQLiteDatabase
 from whirr.models.api import (
     HealthResponse,
     HeartbeatResponse,
+    JobBulkCreate,
+    JobBulkCreateResponse,
     JobCancelResponse,
     JobClaim,
     JobClaimResponse,
@@ -58,7 +59,7 @@ logger = logging.getLogger(__name__)
 class _ServerState:
     db: Database | None = None
     lease_monitor_thread: Thread | None = None
-    shutdown_flag: bool = False
+    shutdown_event: Event = field(default_factory=Event)
 
 
 _state = _ServerState()
@@ -125,19 +126,20 @@ def _get_data_dir(app: FastAPI) -> Path:
 
 def _lease_monitor_loop(db: Database, interval: int = 30) -> None:
     """Background thread to check for expired leases and requeue jobs."""
-    while not _state.shutdown_flag:
+    while not _state.shutdown_event.is_set():
         try:
             _ = db.requeue_expired_jobs()
         except Exception as exc:
             logger.exception("Lease monitor error", exc_info=exc)
-        sleep(interval)
+        # Wake immediately on shutdown instead of sleeping out the interval
+        _ = _state.shutdown_event.wait(timeout=interval)
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     """Lifecycle manager for the FastAPI app."""
     # Start lease monitor thread
-    _state.shutdown_flag = False
+    _state.shutdown_event.clear()
     if _state.db is not None:
         _state.lease_monitor_thread = Thread(
             target=_lease_monitor_loop,
@@ -149,7 +151,7 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     yield
 
     # Shutdown
-    _state.shutdown_flag = True
+    _state.shutdown_event.set()
     if _state.lease_monitor_thread is not None:
         _state.lease_monitor_thread.join(timeout=5)
 
@@ -276,6 +278,18 @@ def create_app(  # noqa: C901, PLR0915
             message=f"Job {job_id} created",
         )
 
+    @app.post("/api/v1/jobs/bulk", response_model=JobBulkCreateResponse)
+    def create_jobs(
+        request: JobBulkCreate,
+        db: Annotated[Database, Depends(get_db)],
+    ) -> JobBulkCreateResponse:
+        """Submit many jobs to the queue in a single transaction."""
+        job_ids = db.create_jobs(request.jobs)
+        return JobBulkCreateResponse(
+            job_ids=job_ids,
+            message=f"{len(job_ids)} jobs created",
+        )
+
     @app.post("/api/v1/jobs/claim", response_model=JobClaimResponse)
     def claim_job(
         request: JobClaim,
@@ -4,6 +4,8 @@
 from whirr.models.api import (
     ErrorResponse,
     HeartbeatResponse,
+    JobBulkCreate,
+    JobBulkCreateResponse,
     JobClaim,
     JobClaimResponse,
     JobComplete,
@@ -22,6 +24,8 @@ from whirr.models.api import (
 __all__ = [
     "ErrorResponse",
     "HeartbeatResponse",
+    "JobBulkCreate",
+    "JobBulkCreateResponse",
     "JobClaim",
     "JobClaimResponse",
     "JobComplete",
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING, Optional, TypedDict, cast
 import yaml
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
     from whirr.models.base import JSONValue
@@ -93,6 +93,43 @@ def generate_grid_combinations(
         yield dict(zip(param_names, combo))
 
 
+def _make_sampler(
+    name: str,
+    spec: SweepParamSpec,
+    rng: random.Random,
+) -> Callable[[], JSONValue]:
+    """Build a zero-argument sampler for one parameter.
+
+    Distribution dispatch and bound conversion happen once here rather than
+    on every draw.
+    """
+    if "values" in spec:
+        values = spec["values"]
+        return lambda: rng.choice(values)
+
+    if "distribution" not in spec:
+        msg = f"Parameter '{name}' must have 'values' or 'distribution'"
+        raise ValueError(msg)
+
+    dist = spec["distribution"]
+    min_val = float(spec.get("min", 0.0))
+    max_val = float(spec.get("max", 1.0))
+
+    if dist == "uniform":
+        return lambda: rng.uniform(min_val, max_val)
+    if dist == "log_uniform":
+        log_min = math.log(min_val)
+        log_max = math.log(max_val)
+        return lambda: math.exp(rng.uniform(log_min, log_max))
+    if dist == "int_uniform":
+        int_min = int(min_val)
+        int_max = int(max_val)
+        return lambda: rng.randint(int_min, int_max)
+
+    msg = f"Unknown distribution: {dist}"
+    raise ValueError(msg)
+
+
 def generate_random_combinations(
     parameters: dict[str, SweepParamSpec],
     max_runs: int,
@@ -106,64 +143,73 @@ def generate_random_combinations(
     - min/max: range for distributions
     """
     rng = random.Random(seed)  # noqa: S311
+    samplers = [
+        (name, _make_sampler(name, spec, rng)) for name, spec in parameters.items()
+    ]
 
     for _ in range(max_runs):
-        config: dict[str, JSONValue] = {}
-        for name, spec in parameters.items():
-            if "values" in spec:
-                config[name] = rng.choice(spec["values"])
-            elif "distribution" in spec:
-                dist = spec["distribution"]
-                min_val = float(spec.get("min", 0.0))
-                max_val = float(spec.get("max", 1.0))
-
-                if dist == "uniform":
-                    config[name] = rng.uniform(min_val, max_val)
-                elif dist == "log_uniform":
-                    log_min = math.log(min_val)
-                    log_max = math.log(max_val)
-                    config[name] = math.exp(rng.uniform(log_min, log_max))
-                elif dist == "int_uniform":
-                    config[name] = rng.randint(int(min_val), int(max_val))
-                else:
-                    msg = f"Unknown distribution: {dist}"
-                    raise ValueError(msg)
-            else:
-                msg = f"Parameter '{name}' must have 'values' or 'distribution'"
+        yield {name: sample() for name, sample in samplers}
+
+
+def sweep_size(sweep: SweepConfig) -> int:
+    """Return the number of jobs a sweep will generate, without generating them.
+
+    Also validates the sweep method and its required fields.
+    """
+    if sweep.method == "grid":
+        sizes: list[int] = []
+        for name, spec in sweep.parameters.items():
+            values = spec.get("values")
+            if values is None:
+                msg = f"Parameter '{name}' must have 'values' for grid sweep"
                 raise ValueError(msg)
-        yield config
+            sizes.append(len(values))
+        return math.prod(sizes)
+    if sweep.method == "random":
+        if sweep.max_runs is None:
+            msg = "Random sweeps require 'max_runs' to be set"
+            raise ValueError(msg)
+        return sweep.max_runs
+    msg = f"Unknown sweep method: {sweep.method}"
+    raise ValueError(msg)
 
 
 def generate_sweep_jobs(
     sweep: SweepConfig,
     prefix: str | None = None,
-) -> list[SweepJob]:
+) -> Iterator[SweepJob]:
     """Generate all jobs for a sweep configuration.
 
-    Returns list of SweepJob objects with command, name, tags, and config.
+    Yields SweepJob objects with command, name, tags, and config. Jobs are
+    produced lazily, so use sweep_size() when only the count is needed.
+    Configuration errors are raised immediately rather than on iteration.
     """
+    # Validate up front so callers see errors before consuming the iterator
+    _ = sweep_size(sweep)
+
     # Determine base name
     base_name = prefix or sweep.name or "sweep"
 
     # Generate parameter combinations
     if sweep.method == "grid":
-        combinations = list(generate_grid_combinations(sweep.parameters))
-    elif sweep.method == "random":
-        if sweep.max_runs is None:
-            msg = "Random sweeps require 'max_runs' to be set"
-            raise ValueError(msg)
-        combinations = list(
-            generate_random_combinations(sweep.parameters, sweep.max_runs)
-        )
+        combinations = generate_grid_combinations(sweep.parameters)
     else:
-        msg = f"Unknown sweep method: {sweep.method}"
-        raise ValueError(msg)
+        combinations = generate_random_combinations(
+            sweep.parameters, cast("int", sweep.max_runs)
+        )
 
-    # Build jobs
-    jobs: list[SweepJob] = []
+    return _build_sweep_jobs(sweep.program, base_name, combinations)
+
+
+def _build_sweep_jobs(
+    program: str,
+    base_name: str,
+    combinations: Iterator[dict[str, JSONValue]],
+) -> Iterator[SweepJob]:
+    """Turn parameter combinations into SweepJob objects one at a time."""
     for i, params in enumerate(combinations):
         # Build command with parameters as CLI args
-        command = sweep.program.split()
+        command = program.split()
         for key, value in params.items():
             # Format value appropriately
             if isinstance(value, float):
@@ -182,13 +228,9 @@ def generate_sweep_jobs(
         # Tags include sweep name
         tags = [f"sweep:{base_name}"]
 
-        jobs.append(
-            SweepJob(
-                command=command,
-                name=job_name,
-                tags=tags,
-                config=params,
-            )
+        yield SweepJob(
+            command=command,
+            name=job_name,
+            tags=tags,
+            config=params,
         )
-
-    return jobs
@@ -19,6 +19,7 @@ except ImportError:
 
 if TYPE_CHECKING:
     from pathlib import Path
+    from typing import BinaryIO
 
 logger = logging.getLogger(__name__)
 GPU_FIELD_COUNT = 4
@@ -157,6 +158,7 @@ class SystemMetricsCollector:
     _stop_event: Event
     _thread: Thread | None
     _metrics_path: Path
+    first_sample_written: Event
 
     def __init__(self, run_dir: Path, interval: float = 10.0) -> None:
         """Initialize collector.
@@ -171,6 +173,8 @@ class SystemMetricsCollector:
         self._stop_event = Event()
         self._thread = None
         self._metrics_path = run_dir / "system.jsonl"
+        # Set once the first sample has been flushed to system.jsonl
+        self.first_sample_written = Event()
 
     def start(self) -> None:
         """Start background collection."""
@@ -191,19 +195,31 @@ class SystemMetricsCollector:
         self._thread = None
 
     def _collection_loop(self) -> None:
-        """Background collection loop."""
-        while not self._stop_event.is_set():
-            try:
-                metrics = collect_metrics()
-                self._write_metrics(metrics)
-            except Exception as exc:
-                logger.exception("System metrics collection failed", exc_info=exc)
+        """Background collection loop.
 
-            _ = self._stop_event.wait(timeout=self._interval)
+        system.jsonl stays open for the life of the thread instead of being
+        reopened for every sample.
+        """
+        try:
+            f = self._metrics_path.open("ab")
+        except OSError as exc:
+            logger.exception("Could not open system metrics file", exc_info=exc)
+            return
+
+        with f:
+            while not self._stop_event.is_set():
+                try:
+                    metrics = collect_metrics()
+                    self._write_metrics(f, metrics)
+                    self.first_sample_written.set()
+                except Exception as exc:
+                    logger.exception("System metrics collection failed", exc_info=exc)
+
+                _ = self._stop_event.wait(timeout=self._interval)
 
-    def _write_metrics(self, metrics: SystemMetrics) -> None:
+    def _write_metrics(self, f: BinaryIO, metrics: SystemMetrics) -> None:
         """Append metrics to system.jsonl."""
-        with self._metrics_path.open("a") as f:
-            record = SystemMetricRecord.model_validate(metrics.to_dict())
-            _ = f.write(record.model_dump_json(by_alias=True) + "\n")
-            _ = f.flush()
+        record = SystemMetricRecord.model_validate(metrics.to_dict())
+        _ = f.write(record.model_dump_json(by_alias=True).encode() + b"\n")
+        # Flush per sample so the dashboard can tail the file live
+        f.flush()
@@ -1,16 +1,100 @@
 # Copyright (c) Syntropy Systems
 """Pytest fixtures for whirr tests."""
 
+from __future__ import annotations
+
+import importlib
+import mmap
 import os
+import shutil
 import sqlite3
 import tempfile
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
-# Store original cwd at module load time
-_original_cwd = Path.cwd()
+from whirr.config import use_project_dir
+from whirr.db import SQLiteDatabase
+from whirr.models.run import RunConfig
+
+# Modules whose import cost should not be billed to the first test
+_PRELOAD_MODULES = (
+    "whirr.db",
+    "whirr.run",
+    "whirr.runner",
+    "whirr.models.run",
+    "whirr.models.db",
+    "whirr.cli.export",
+    "whirr.cli.compare",
+)
+# Same, but these need optional extras (fastapi) and may be missing
+_OPTIONAL_PRELOAD_MODULES = ("whirr.dashboard",)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_modules() -> None:
+    """Import core whirr modules once per session, before any test runs."""
+    for name in _PRELOAD_MODULES:
+        _ = importlib.import_module(name)
+    for name in _OPTIONAL_PRELOAD_MODULES:
+        with suppress(ImportError):
+            _ = importlib.import_module(name)
+
+
+@pytest.fixture(scope="session")
+def db_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build an initialized whirr.db once per session for tests to copy."""
+    from whirr.db import init_db
+
+    template = tmp_path_factory.mktemp("db-template") / "whirr.db"
+    init_db(template)
+    return template
+
+
+@pytest.fixture
+def db_path(db_template: Path, tmp_path: Path) -> Path:
+    """Copy the session's initialized DB template into this test's tmp_path."""
+    path = tmp_path / "test.db"
+    _ = shutil.copyfile(db_template, path)
+    return path
+
+
+@pytest.fixture
+def mem_db(db_template: Path) -> Generator[SQLiteDatabase, None, None]:
+    """Create an in-memory SQLiteDatabase cloned from the session template."""
+    db = SQLiteDatabase(":memory:")
+    template = sqlite3.connect(db_template)
+    try:
+        # Page copy is ~10x cheaper than re-running the schema DDL
+        template.backup(db.conn)
+    finally:
+        template.close()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def sqlite_tuning(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Opt this test's connections into the SQLite tuning pragmas.
+
+    Test databases live on local tmpfs, where the pragmas are safe. Scoped to
+    the test so spawned jobs and other tests keep the untuned default.
+    """
+    monkeypatch.setenv("WHIRR_SQLITE_WAL", "1")
+
+
+@pytest.fixture
+def sqlite_db(
+    db_path: Path, sqlite_tuning: None
+) -> Generator[SQLiteDatabase, None, None]:
+    """Open a file-backed SQLiteDatabase on a copy of the session template."""
+    _ = sqlite_tuning
+    db = SQLiteDatabase(db_path)
+    yield db
+    db.close()
 
 
 @pytest.fixture
@@ -34,21 +118,53 @@ def whirr_project(temp_dir: Path) -> Generator[Path, None, None]:
     db_path = whirr_dir / "whirr.db"
     init_db(db_path)
 
-    # Change to temp directory
-    os.chdir(temp_dir)
-
-    yield temp_dir
-
-    # Always return to original cwd
-    os.chdir(_original_cwd)
+    # Point whirr at the temp directory without touching the process cwd
+    with use_project_dir(temp_dir):
+        yield temp_dir
 
 
 @pytest.fixture
-def db_connection(whirr_project: Path) -> Generator[sqlite3.Connection, None, None]:
+def db_connection(
+    whirr_project: Path, sqlite_tuning: None
+) -> Generator[sqlite3.Connection, None, None]:
     """Get a database connection for the test project."""
     from whirr.db import get_connection
 
+    _ = sqlite_tuning
     db_path = whirr_project / ".whirr" / "whirr.db"
     conn = get_connection(db_path)
     yield conn
     conn.close()
+
+
+@lru_cache(maxsize=128)
+def _read_config_cached(path_str: str, mtime_ns: int) -> RunConfig:
+    """Parse a config.json once per (path, mtime) pair."""
+    _ = mtime_ns  # Part of the cache key only
+    return RunConfig.model_validate_json(Path(path_str).read_bytes())
+
+
+@pytest.fixture
+def read_config() -> Callable[[Path], RunConfig]:
+    """Return a reader that parses config.json, reusing results for unchanged files."""
+
+    def _read(path: Path) -> RunConfig:
+        return _read_config_cached(str(path), path.stat().st_mtime_ns)
+
+    return _read
+
+
+def _log_contains(path: Path, *needles: str | bytes) -> bool:
+    """Check that every needle occurs in the file, scanning one mmap'd buffer."""
+    encoded = [n.encode() if isinstance(n, str) else n for n in needles]
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return not any(encoded)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return all(mm.find(n) != -1 for n in encoded)
+
+
+@pytest.fixture
+def log_contains() -> Callable[..., bool]:
+    """Return a helper that checks a log file for one or more substrings."""
+    return _log_contains
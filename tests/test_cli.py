@@ -1,12 +1,12 @@
 # Copyright (c) Syntropy Systems
 """Tests for whirr CLI commands."""
 
-import os
 from pathlib import Path
 
 from typer.testing import CliRunner
 
 from whirr.cli.main import app
+from whirr.config import use_project_dir
 
 runner = CliRunner()
 
@@ -16,9 +16,8 @@ class TestInitCommand:
 
     def test_init_creates_directory(self, temp_dir: Path) -> None:
         """Test that init creates .whirr directory."""
-        os.chdir(temp_dir)
-
-        result = runner.invoke(app, ["init"])
+        with use_project_dir(temp_dir):
+            result = runner.invoke(app, ["init"])
 
         assert result.exit_code == 0
         assert (temp_dir / ".whirr").exists()
@@ -187,9 +186,8 @@ class TestDoctorCommand:
 
     def test_doctor_not_initialized(self, temp_dir: Path) -> None:
         """Test doctor when not initialized."""
-        os.chdir(temp_dir)
-
-        result = runner.invoke(app, ["doctor"])
+        with use_project_dir(temp_dir):
+            result = runner.invoke(app, ["doctor"])
 
         assert result.exit_code == 0
         assert "No .whirr directory found" in result.stdout
@@ -2,14 +2,21 @@
 """Tests for whirr database operations."""
 
 import sqlite3
+from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import pytest
+from pydantic import ValidationError
 
 from whirr.db import (
     cancel_job,
     claim_job,
     complete_job,
     complete_run,
+    count_runs,
     create_job,
+    create_jobs_bulk,
     create_run,
     get_active_jobs,
     get_job,
@@ -19,6 +26,14 @@ from whirr.db import (
     register_worker,
     unregister_worker,
 )
+from whirr.models.api import JobCreate
+
+if TYPE_CHECKING:
+    from whirr.models.base import JSONObject
+
+# Values the old RunConfig/RunSummary validation rejected rather than coerced
+_NON_JSON_VALUES = [(1, 2), Path("model.pt"), date(2024, 1, 1), {"a"}]
+_NON_JSON_IDS = ["tuple", "path", "date", "set"]
 
 
 class TestJobOperations:
@@ -42,6 +57,74 @@ class TestJobOperations:
         assert job.status == "queued"
         assert job.workdir == "/tmp/test"
 
+    def test_create_jobs_bulk(self, db_connection: sqlite3.Connection) -> None:
+        """Test creating many jobs in one transaction."""
+        before = db_connection.total_changes
+        job_ids = create_jobs_bulk(
+            db_connection,
+            [
+                JobCreate(
+                    command_argv=["python", "train.py", "--lr", str(lr)],
+                    workdir="/tmp/test",
+                    name=f"bulk-{i}",
+                    config={"lr": lr},
+                    tags=["sweep:bulk"],
+                )
+                for i, lr in enumerate([0.1, 0.01, 0.001])
+            ],
+        )
+
+        assert job_ids == [1, 2, 3]
+        assert db_connection.total_changes - before == 3
+
+        job = get_job(db_connection, job_ids[-1])
+        assert job is not None
+        assert job.name == "bulk-2"
+        assert job.status == "queued"
+        assert job.attempt == 1
+        assert job.tags == ["sweep:bulk"]
+        assert job.config is not None
+        assert job.config.model_dump() == {"lr": 0.001}
+
+    def test_create_jobs_bulk_ids_match_rows(
+        self, db_connection: sqlite3.Connection
+    ) -> None:
+        """Test that bulk IDs map to the inserted rows after existing jobs."""
+        _ = create_job(db_connection, command_argv=["true"], workdir="/tmp")
+        job_ids = create_jobs_bulk(
+            db_connection,
+            [
+                JobCreate(command_argv=["true"], workdir="/tmp", name=f"after-{i}")
+                for i in range(3)
+            ],
+        )
+
+        assert job_ids == [2, 3, 4]
+        jobs = [get_job(db_connection, job_id) for job_id in job_ids]
+        assert [job.name for job in jobs if job] == ["after-0", "after-1", "after-2"]
+
+    def test_create_jobs_bulk_in_caller_transaction(
+        self, db_connection: sqlite3.Connection
+    ) -> None:
+        """Test that a bulk insert joins, and never ends, the caller's transaction."""
+        _ = db_connection.execute("BEGIN")
+        _ = db_connection.execute(
+            "INSERT INTO jobs (command_argv, workdir) VALUES ('[\"true\"]', '/tmp')"
+        )
+        job_ids = create_jobs_bulk(
+            db_connection, [JobCreate(command_argv=["true"], workdir="/tmp")]
+        )
+
+        assert job_ids == [2]
+        assert db_connection.in_transaction
+        db_connection.rollback()
+        assert get_job(db_connection, 1) is None
+        assert get_job(db_connection, 2) is None
+
+    def test_create_jobs_bulk_empty(self, db_connection: sqlite3.Connection) -> None:
+        """Test that an empty batch is a no-op."""
+        assert create_jobs_bulk(db_connection, []) == []
+
     def test_claim_job(self, db_connection: sqlite3.Connection) -> None:
         """Test atomic job claiming."""
         # Create a job
@@ -58,6 +141,9 @@ class TestJobOperations:
         assert job is not None
         assert job.command_argv == ["python", "test.py"]
         assert job.workdir == "/tmp/test"
+        assert job.status == "running"
+        assert job.worker_id == "worker-1"
+        assert job.started_at is not None
 
         # Job should now be running
         updated = get_job(db_connection, job.id)
@@ -173,6 +259,19 @@ class TestJobOperations:
         # Should have 2 jobs (one running, one queued)
         assert len(active) == 2
 
+    @pytest.mark.parametrize("value", _NON_JSON_VALUES, ids=_NON_JSON_IDS)
+    def test_create_job_rejects_non_json_config(
+        self, db_connection: sqlite3.Connection, value: object
+    ) -> None:
+        """Test job config values that are not plain JSON are rejected."""
+        with pytest.raises(ValidationError):
+            _ = create_job(
+                db_connection,
+                command_argv=["python", "train.py"],
+                workdir="/tmp/test",
+                config=cast("JSONObject", {"bad": value}),
+            )
+
 
 class TestRunOperations:
     """Tests for run CRUD operations."""
@@ -220,6 +319,21 @@ class TestRunOperations:
         assert run.status == "completed"
         assert run.finished_at is not None
 
+    @pytest.mark.parametrize("value", _NON_JSON_VALUES, ids=_NON_JSON_IDS)
+    def test_complete_run_rejects_non_json_summary(
+        self, db_connection: sqlite3.Connection, value: object
+    ) -> None:
+        """Test run summary values that are not plain JSON are rejected."""
+        create_run(db_connection, run_id="test-run", run_dir="/tmp/test-run")
+
+        with pytest.raises(ValidationError):
+            complete_run(
+                db_connection,
+                run_id="test-run",
+                status="completed",
+                summary=cast("JSONObject", {"bad": value}),
+            )
+
     def test_get_runs_with_filters(self, db_connection: sqlite3.Connection, temp_dir: Path) -> None:
         """Test filtering runs."""
         for i in range(3):
@@ -244,6 +358,12 @@ class TestRunOperations:
         test_runs = get_runs(db_connection, tag="test")
         assert len(test_runs) == 2
 
+        # Counts use the same filters without loading rows
+        assert count_runs(db_connection) == 3
+        assert count_runs(db_connection, status="completed") == 1
+        assert count_runs(db_connection, tag="test") == 2
+        assert count_runs(db_connection, limit=2) == 2
+
 
 class TestWorkerOperations:
     """Tests for worker registration."""
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import re
 import sys
 import time
 from pathlib import Path
@@ -20,6 +21,8 @@ from whirr.run import Run, read_metrics
 from whirr.runner import JobRunner
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from whirr.models.db import JobRecord
 
 
@@ -72,7 +75,9 @@ class TestWorkerEndToEnd:
         assert log_path.exists()
         assert "hello from job" in log_path.read_text()
 
-    def test_job_captures_stderr(self, whirr_project: Path) -> None:
+    def test_job_captures_stderr(
+        self, whirr_project: Path, log_contains: Callable[..., bool]
+    ) -> None:
         """Test that stderr is captured in output.log."""
         db_path = whirr_project / ".whirr" / "whirr.db"
         runs_dir = whirr_project / ".whirr" / "runs"
@@ -103,7 +108,7 @@ class TestWorkerEndToEnd:
         _ = runner.wait()
 
         log_path = run_dir / "output.log"
-        assert "error output" in log_path.read_text()
+        assert log_contains(log_path, "error output")
 
     def test_job_nonzero_exit_code(self, whirr_project: Path) -> None:
         """Test that non-zero exit codes are captured."""
@@ -141,6 +146,7 @@ class TestWorkerEndToEnd:
 class TestCancelRunningJob:
     """Test that cancellation actually kills running processes."""
 
+    @pytest.mark.slow
     def test_cancel_kills_running_process(self, whirr_project: Path) -> None:
         """Test that cancelling a running job terminates the process."""
         db_path = whirr_project / ".whirr" / "whirr.db"
@@ -183,24 +189,26 @@ class TestCancelRunningJob:
         # Exit code should indicate termination (negative on Unix = signal)
         assert exit_code != 0
 
+    @pytest.mark.slow
     def test_cancel_kills_entire_process_group(self, whirr_project: Path) -> None:
         """Test that cancel kills child processes too (process group)."""
         db_path = whirr_project / ".whirr" / "whirr.db"
         runs_dir = whirr_project / ".whirr" / "runs"
 
-        # Create a job that spawns a subprocess
+        # Create a job that forks a child process
         # The parent sleeps, child writes to file every 0.1s
         marker_file = whirr_project / "child_alive.txt"
         script = f"""
-import subprocess
+import os
 import time
-import sys
 
-# Spawn a child that keeps writing
-child = subprocess.Popen([
-    sys.executable, '-c',
-    "import time; f=open('{marker_file}', 'a'); [f.write(str(i)+'\\\\\\\\n') or f.flush() or time.sleep(0.1) for i in range(1000)]"
-])
+# Fork a child (same process group) that keeps writing
+if os.fork() == 0:
+    fd = os.open('{marker_file}', os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+    for i in range(1000):
+        os.write(fd, b'%d\\n' % i)
+        time.sleep(0.1)
+    os._exit(0)
 
 # Parent just waits
 time.sleep(60)
@@ -375,10 +383,9 @@ for i in range(5):
         # Wait for job to complete
         _ = runner.wait()
 
-        # Verify all output captured
-        content = log_path.read_text()
-        for i in range(5):
-            assert f"line {i}" in content
+        # Verify all output captured (single pass over the log)
+        found = set(re.findall(rb"line (\d)", log_path.read_bytes()))
+        assert found >= {b"0", b"1", b"2", b"3", b"4"}
 
 
 class TestWorkerWorkdir:
@@ -1,6 +1,7 @@
 # Copyright (c) Syntropy Systems
 """Tests for whirr Run class."""
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -125,7 +126,9 @@ class TestRun:
         run.finish()
         run.finish()  # Should not raise
 
-    def test_run_with_config_and_tags(self, whirr_project: Path) -> None:
+    def test_run_with_config_and_tags(
+        self, whirr_project: Path, read_config: Callable[[Path], RunConfig]
+    ) -> None:
         """Test run with configuration and tags."""
         _ = whirr_project
         run = Run(
@@ -143,8 +146,7 @@ class TestRun:
 
         # Config is now in separate file
         config_path = run.run_dir / "config.json"
-        config = RunConfig.model_validate_json(config_path.read_text())
-        assert config.model_dump() == {"lr": 0.01, "batch_size": 32}
+        assert read_config(config_path).model_dump() == {"lr": 0.01, "batch_size": 32}
 
 
     def test_save_artifact(self, whirr_project: Path) -> None:
@@ -196,10 +198,8 @@ class TestReadMetrics:
     def test_read_truncated_line(self, temp_dir: Path) -> None:
         """Test that truncated final line is ignored."""
         metrics_path = temp_dir / "metrics.jsonl"
-        with metrics_path.open("w") as f:
-            _ = f.write('{"loss": 1.0}\n')
-            _ = f.write('{"loss": 0.5}\n')
-            _ = f.write('{"loss": 0')  # Truncated
+        lines = ['{"loss": 1.0}', '{"loss": 0.5}', '{"loss": 0']  # Last is truncated
+        _ = metrics_path.write_text("\n".join(lines))
 
         metrics = read_metrics(metrics_path)
 
@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import json
 import sqlite3
-import time
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
@@ -23,11 +22,12 @@ from whirr.db import (
     requeue_orphaned_jobs,
     retry_job,
 )
-from whirr.sweep import SweepConfig, generate_sweep_jobs
+from whirr.sweep import SweepConfig, generate_sweep_jobs, sweep_size
 
 if TYPE_CHECKING:
     from whirr.models.base import JSONObject
     from whirr.models.db import JobRecord
+    from whirr.system_metrics import SystemMetricsCollector
 
 runner = CliRunner()
 
@@ -73,6 +73,26 @@ class TestOrphanDetection:
         orphaned = get_orphaned_jobs(db_connection, timeout_seconds=60)
         assert len(orphaned) == 0
 
+    def test_get_orphaned_jobs_scan_uses_index(
+        self, db_connection: sqlite3.Connection
+    ) -> None:
+        """Test that the orphan scan is an index range scan, not a table scan."""
+        # Plan the statement get_orphaned_jobs() actually runs
+        statements: list[str] = []
+        db_connection.set_trace_callback(statements.append)
+        try:
+            _ = get_orphaned_jobs(db_connection, timeout_seconds=60)
+        finally:
+            db_connection.set_trace_callback(None)
+        (query,) = (sql for sql in statements if "FROM jobs" in sql)
+
+        rows = cast(
+            "list[sqlite3.Row]",
+            db_connection.execute(f"EXPLAIN QUERY PLAN {query}").fetchall(),
+        )
+        plan = " ".join(cast("str", row["detail"]) for row in rows)
+        assert "USING INDEX idx_jobs_status_heartbeat" in plan
+
     def test_requeue_orphaned_jobs(self, db_connection: sqlite3.Connection) -> None:
         """Test that orphaned jobs are requeued correctly."""
         # Create and claim a job
@@ -94,6 +114,9 @@ class TestOrphanDetection:
         # Requeue orphaned jobs
         requeued = requeue_orphaned_jobs(db_connection, timeout_seconds=60)
         assert len(requeued) == 1
+        assert requeued[0].id == job_id
+        assert requeued[0].status == "queued"
+        assert requeued[0].attempt == 2
 
         # Job should be back to queued status
         job = get_job(db_connection, job_id)
@@ -215,9 +238,10 @@ parameters:
 """)
 
         config = SweepConfig.from_yaml(config_path)
-        jobs = generate_sweep_jobs(config)
 
         # Should have 2 * 2 = 4 combinations
+        assert sweep_size(config) == 4
+        jobs = list(generate_sweep_jobs(config))
         assert len(jobs) == 4
 
         # Check that all combinations are present
@@ -245,7 +269,8 @@ parameters:
 """)
 
         config = SweepConfig.from_yaml(config_path)
-        jobs = generate_sweep_jobs(config)
+        assert sweep_size(config) == 5
+        jobs = list(generate_sweep_jobs(config))
 
         assert len(jobs) == 5
 
@@ -291,6 +316,15 @@ parameters:
         result = runner.invoke(app, ["sweep", str(config_path)])
         assert result.exit_code == 0
         assert "Submitted 3 jobs" in result.stdout
+        assert "1-3" in result.stdout
+
+        conn = get_connection(whirr_project / ".whirr" / "whirr.db")
+        try:
+            jobs = [get_job(conn, job_id) for job_id in (1, 2, 3)]
+        finally:
+            conn.close()
+        names = [job.name for job in jobs if job is not None]
+        assert names == [f"submit-sweep-{i}" for i in range(3)]
 
 
 class TestSystemMetrics:
@@ -304,7 +338,11 @@ class TestSystemMetrics:
         run = Run(name="metrics-test", system_metrics=True, system_metrics_interval=0.1)
 
         # Wait for at least one collection
-        time.sleep(0.3)
+        collector = cast(
+            "SystemMetricsCollector",
+            getattr(run, "_system_metrics_collector"),  # noqa: B009
+        )
+        assert collector.first_sample_written.wait(timeout=2.0)
 
         run.finish()
 
@@ -326,7 +364,6 @@ class TestSystemMetrics:
         from whirr.run import Run
 
         run = Run(name="no-metrics-test", system_metrics=False)
-        time.sleep(0.2)
         run.finish()
 
         # system.jsonl should not exist
@@ -1,26 +1,33 @@
 # Copyright (c) Syntropy Systems
 """Tests for v0.3 features: dashboard, compare, export, git capture, pip freeze."""
 
+from __future__ import annotations
+
+import csv
 import json
 import os
-import re
+import shutil
+import subprocess
 from collections.abc import Callable, Generator
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Protocol, cast
 
 import pytest
+from typer.testing import CliRunner
 
 from whirr import run as run_module
 from whirr.cli.main import app
-from whirr.db import init_db
+from whirr.config import use_project_dir
 from whirr.models.run import GitInfo, RunMeta
 from whirr.run import Run
 
 if TYPE_CHECKING:
     from whirr.models.base import JSONObject
 
+runner = CliRunner()
+
 _capture_git_info = cast(
-    "Callable[[], GitInfo | None]",
+    "Callable[..., GitInfo | None]",
     getattr(run_module, "_capture_git_info"),  # noqa: B009
 )
 _capture_pip_freeze = cast(
@@ -29,26 +36,79 @@ _capture_pip_freeze = cast(
 )
 
 
-def strip_ansi(text: str) -> str:
-    """Strip ANSI escape codes from text."""
-    return re.sub(r"\x1b\[[0-9;]*m", "", text)
+class _LRUCached(Protocol):
+    """The part of an lru_cache wrapper these tests use."""
+
+    def cache_clear(self) -> None: ...
+
+
+_git_remote_cached = cast(
+    "_LRUCached",
+    getattr(run_module, "_git_remote_cached"),  # noqa: B009
+)
+_pip_freeze_cached = cast(
+    "_LRUCached",
+    getattr(run_module, "_pip_freeze_cached"),  # noqa: B009
+)
+
+
+def _count_commands(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Record argv of every command run by whirr.run, still executing it."""
+    calls: list[list[str]] = []
+    original = cast(
+        "Callable[..., subprocess.CompletedProcess[str] | None]",
+        getattr(run_module, "_run_command"),  # noqa: B009
+    )
+
+    def counting(
+        argv: list[str], *, timeout: float, cwd: Path | None = None
+    ) -> subprocess.CompletedProcess[str] | None:
+        calls.append(argv)
+        return original(argv, timeout=timeout, cwd=cwd)
+
+    monkeypatch.setattr(run_module, "_run_command", counting)
+    return calls
+
+
+_FAKE_FREEZE = "numpy==1.0\ntorch==2.0\n"
+# Resolved once so test repos are built with a known executable, not a PATH lookup
+_GIT = shutil.which("git")
+
+
+@pytest.fixture
+def fake_pip_freeze(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[list[list[str]], None, None]:
+    """Answer every command run by whirr.run with canned pip freeze output."""
+    calls: list[list[str]] = []
+
+    def fake(
+        argv: list[str], *, timeout: float, cwd: Path | None = None
+    ) -> subprocess.CompletedProcess[str] | None:
+        _ = timeout, cwd
+        calls.append(argv)
+        return subprocess.CompletedProcess(argv, 0, stdout=_FAKE_FREEZE, stderr="")
+
+    _pip_freeze_cached.cache_clear()
+    monkeypatch.setattr(run_module, "_run_command", fake)
+    yield calls
+    # Don't leak the canned packages into later tests
+    _pip_freeze_cached.cache_clear()
 
 
 @pytest.fixture
-def whirr_dir(tmp_path: Path) -> Generator[Path, None, None]:
+def whirr_dir(tmp_path: Path, db_template: Path) -> Generator[Path, None, None]:
     """Create a whirr project directory."""
     whirr_path = tmp_path / ".whirr"
     whirr_path.mkdir()
     (whirr_path / "runs").mkdir()
 
-    db_path = whirr_path / "whirr.db"
-    init_db(db_path)
+    # Copy the session's pre-built schema instead of running init_db again
+    _ = shutil.copyfile(db_template, whirr_path / "whirr.db")
 
-    # Change to tmp_path so whirr can find .whirr
-    old_cwd = Path.cwd()
-    os.chdir(tmp_path)
-    yield tmp_path
-    os.chdir(old_cwd)
+    # Point whirr at tmp_path without touching the process-wide cwd
+    with use_project_dir(tmp_path):
+        yield tmp_path
 
 
 class TestGitCapture:
@@ -68,20 +128,84 @@ class TestGitCapture:
 
     def test_capture_git_info_not_in_repo(self, tmp_path: Path) -> None:
         """Test git capture returns None when not in a git repo."""
-        old_cwd = Path.cwd()
-        os.chdir(tmp_path)
-        try:
-            git_info = _capture_git_info()
-            assert git_info is None
-        finally:
-            os.chdir(old_cwd)
+        git_info = _capture_git_info(tmp_path)
+        assert git_info is None
+
+    @pytest.mark.skipif(_GIT is None, reason="git not installed")
+    def test_capture_git_info_single_status_call(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test repeat captures run one git status and stay fresh."""
+        git = cast("str", _GIT)
+        git_env = {
+            **os.environ,
+            "GIT_AUTHOR_NAME": "t",
+            "GIT_AUTHOR_EMAIL": "t@t",
+            "GIT_COMMITTER_NAME": "t",
+            "GIT_COMMITTER_EMAIL": "t@t",
+        }
+        for argv in (
+            ["init", "-q", "-b", "main"],
+            ["commit", "-q", "--allow-empty", "-m", "one"],
+        ):
+            _ = subprocess.run(  # noqa: S603
+                [git, *argv],
+                cwd=tmp_path,
+                check=True,
+                env=git_env,
+            )
+        _git_remote_cached.cache_clear()
+
+        first = _capture_git_info(tmp_path)
+        assert first is not None
+        assert first.branch == "main"
+        assert first.short_hash == first.commit[:7]
+        assert not first.dirty
+        assert first.remote is None
+
+        calls = _count_commands(monkeypatch)
+        _ = (tmp_path / "untracked.txt").write_text("x")
+        second = _capture_git_info(tmp_path)
+
+        assert calls == [["git", "status", "--porcelain=v2", "--branch"]]
+        assert second is not None
+        assert second.commit == first.commit
+        assert second.dirty
+
+        # New commits are picked up without any cache invalidation
+        _ = subprocess.run(  # noqa: S603
+            [git, "commit", "-q", "--allow-empty", "-m", "two"],
+            cwd=tmp_path,
+            check=True,
+            env=git_env,
+        )
+        third = _capture_git_info(tmp_path)
+        assert third is not None
+        assert third.commit != first.commit
 
 
 class TestPipCapture:
     """Tests for pip freeze capture."""
 
-    def test_capture_pip_freeze(self) -> None:
-        """Test pip freeze capture returns list or None."""
+    def test_capture_pip_freeze(self, fake_pip_freeze: list[list[str]]) -> None:
+        """Test pip freeze output is parsed into a package list."""
+        _ = fake_pip_freeze
+        assert _capture_pip_freeze() == ["numpy==1.0", "torch==2.0"]
+
+    def test_capture_pip_freeze_is_cached(
+        self, fake_pip_freeze: list[list[str]]
+    ) -> None:
+        """Test pip freeze only shells out once per process."""
+        first = _capture_pip_freeze()
+        second = _capture_pip_freeze()
+
+        assert second == first
+        assert len(fake_pip_freeze) == 1
+
+    @pytest.mark.slow
+    def test_capture_pip_freeze_real(self) -> None:
+        """Test pip freeze capture against the real interpreter."""
+        _pip_freeze_cached.cache_clear()
         packages = _capture_pip_freeze()
         # May return None if pip isn't available in this env
         assert packages is None or isinstance(packages, list)
@@ -126,9 +250,24 @@ class TestRunWithCapture:
 
         run.finish()
 
-    def test_run_captures_pip_freeze(self, whirr_dir: Path) -> None:
+    def test_run_uses_project_dir_without_chdir(self, whirr_dir: Path) -> None:
+        """Test that Run resolves .whirr from the project dir, not the cwd."""
+        assert Path.cwd() != whirr_dir
+        run = Run(
+            name="test-project-dir",
+            capture_git=False,
+            capture_pip=False,
+            system_metrics=False,
+        )
+        run.finish()
+
+        assert run.run_dir.parent == whirr_dir / ".whirr" / "runs"
+
+    def test_run_captures_pip_freeze(
+        self, whirr_dir: Path, fake_pip_freeze: list[list[str]]
+    ) -> None:
         """Test that Run creates requirements.txt when capture_pip=True."""
-        _ = whirr_dir
+        _ = whirr_dir, fake_pip_freeze
         run = Run(
             name="test-pip",
             config={},
@@ -138,9 +277,8 @@ class TestRunWithCapture:
         )
 
         req_path = run.run_dir / "requirements.txt"
-        # May or may not exist depending on pip availability
-        if run.pip_packages:
-            assert req_path.exists()
+        assert run.pip_packages == ["numpy==1.0", "torch==2.0"]
+        assert req_path.read_text() == _FAKE_FREEZE
 
         run.finish()
 
@@ -170,19 +308,13 @@ class TestCompareCommand:
 
     def test_compare_help(self) -> None:
         """Test compare --help works."""
-        from typer.testing import CliRunner
-
-        runner = CliRunner()
         result = runner.invoke(app, ["compare", "--help"])
         assert result.exit_code == 0
         assert "Compare multiple runs" in result.stdout
 
     def test_compare_needs_two_runs(self, whirr_dir: Path) -> None:
         """Test compare requires at least 2 runs."""
-        from typer.testing import CliRunner
-
         _ = whirr_dir
-        runner = CliRunner()
         result = runner.invoke(app, ["compare", "abc123"])
         assert result.exit_code == 1
         assert "Need at least 2 runs" in result.stdout
@@ -193,37 +325,26 @@ class TestExportCommand:
 
     def test_export_help(self) -> None:
         """Test export --help works."""
-        from typer.testing import CliRunner
-
-        runner = CliRunner()
         result = runner.invoke(app, ["export", "--help"])
         assert result.exit_code == 0
         assert "Export runs" in result.stdout
 
     def test_export_requires_valid_extension(self, whirr_dir: Path) -> None:
         """Test export requires .csv or .json extension."""
-        from typer.testing import CliRunner
-
         _ = whirr_dir
-        runner = CliRunner()
         result = runner.invoke(app, ["export", "output.txt"])
         assert result.exit_code == 1
         assert ".csv or .json" in result.stdout
 
     def test_export_json_empty(self, whirr_dir: Path) -> None:
         """Test export to JSON with no runs."""
-        from typer.testing import CliRunner
-
         _ = whirr_dir
-        runner = CliRunner()
         result = runner.invoke(app, ["export", "runs.json"])
         assert result.exit_code == 0
         assert "No runs to export" in result.stdout
 
     def test_export_json_with_runs(self, whirr_dir: Path) -> None:
         """Test export to JSON with runs."""
-        from typer.testing import CliRunner
-
         # Create a test run
         run = Run(
             name="export-test",
@@ -236,7 +357,6 @@ class TestExportCommand:
         run.summary({"final_loss": 0.1})
         run.finish()
 
-        runner = CliRunner()
         output_path = whirr_dir / "runs.json"
         result = runner.invoke(app, ["export", str(output_path)])
         assert result.exit_code == 0
@@ -249,8 +369,6 @@ class TestExportCommand:
 
     def test_export_csv_with_runs(self, whirr_dir: Path) -> None:
         """Test export to CSV with runs."""
-        from typer.testing import CliRunner
-
         # Create a test run
         run = Run(
             name="csv-test",
@@ -262,7 +380,6 @@ class TestExportCommand:
         run.summary({"accuracy": 0.95})
         run.finish()
 
-        runner = CliRunner()
         output_path = whirr_dir / "runs.csv"
         result = runner.invoke(app, ["export", str(output_path)])
         assert result.exit_code == 0
@@ -273,20 +390,71 @@ class TestExportCommand:
         assert "csv-test" in content
         assert "config.lr" in content
 
+        header = content.splitlines()[0].split(",")
+        assert header[-3:] == ["config.epochs", "config.lr", "summary.accuracy"]
+
+    def test_export_csv_unfinished_run_summary(self, whirr_dir: Path) -> None:
+        """Test CSV export keeps summary columns of a run that has not finished."""
+        run = Run(
+            name="running",
+            capture_git=False,
+            capture_pip=False,
+            system_metrics=False,
+        )
+        run.summary({"acc": 0.9})
+
+        output_path = whirr_dir / "runs.csv"
+        result = runner.invoke(app, ["export", str(output_path)])
+        run.finish()
+        assert result.exit_code == 0
+
+        with output_path.open(newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 1
+        assert rows[0]["summary.acc"] == "0.9"
+
+    def test_export_specific_run(self, whirr_dir: Path) -> None:
+        """Test export --run selects runs by ID prefix."""
+        _ = whirr_dir
+        runs = [
+            Run(
+                name=f"prefix-{i}",
+                capture_git=False,
+                capture_pip=False,
+                system_metrics=False,
+            )
+            for i in range(2)
+        ]
+        for run in runs:
+            run.finish()
+
+        output_path = whirr_dir / "one.json"
+        result = runner.invoke(
+            app, ["export", str(output_path), "--run", runs[1].run_id]
+        )
+        assert result.exit_code == 0
+        assert "Exported 1 run" in result.stdout
+        data = cast("list[JSONObject]", json.loads(output_path.read_text()))
+        assert [d["name"] for d in data] == ["prefix-1"]
+
+        result = runner.invoke(app, ["export", str(output_path), "--run", "nope"])
+        assert result.exit_code == 1
+        assert "Run not found" in result.stdout
+
 
 class TestDashboardCommand:
     """Tests for whirr dashboard command."""
 
     def test_dashboard_help(self) -> None:
         """Test dashboard --help works."""
-        from typer.testing import CliRunner
-
-        runner = CliRunner()
-        result = runner.invoke(app, ["dashboard", "--help"])
+        # NO_COLOR wins over FORCE_COLOR in CI, so help renders as plain text
+        result = runner.invoke(
+            app, ["dashboard", "--help"], env={"NO_COLOR": "1", "TERM": "dumb"}
+        )
         assert result.exit_code == 0
-        output = strip_ansi(result.stdout)
-        assert "whirr dashboard" in output
-        assert "--port" in output
+        assert "\x1b" not in result.stdout
+        assert "whirr dashboard" in result.stdout
+        assert "--port" in result.stdout
 
     def test_dashboard_module_imports(self) -> None:
         """Test dashboard module can be imported."""
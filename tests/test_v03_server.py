@@ -4,21 +4,36 @@
 from __future__ import annotations
 
 import importlib.util
-import re
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from typer.testing import CliRunner
 
+import whirr.client as client_module
+from whirr.cli.main import app as cli_app
+from whirr.client import WhirrClient, WhirrClientError
 from whirr.db import (
+    SCHEMA,
     SQLITE_SCHEMA,
     SQLiteDatabase,
+    claim_job,
+    complete_job,
+    create_job,
+    get_connection,
     get_database,
+    get_job,
+    utcnow,
 )
 from whirr.models.api import (
     HealthResponse,
+    JobBulkCreateResponse,
     JobClaimResponse,
     JobCreateResponse,
     JobResponse,
@@ -29,151 +44,219 @@ from whirr.models.api import (
 )
 from whirr.models.db import JobRecord, RunRecord, WorkerRecord
 from whirr.models.run import ArtifactRecord, RunMetricRecord
+from whirr.server.app import create_app, get_db
+from whirr.server.models import JobClaim, JobCreate
 
 if TYPE_CHECKING:
     import sqlite3
+    from collections.abc import Generator, Iterator, Mapping
 
+    from fastapi import FastAPI
 
-def strip_ansi(text: str) -> str:
-    """Strip ANSI escape codes from text."""
-    return re.sub(r"\x1b\[[0-9;]*m", "", text)
+# TestClient needs httpx; probe for it without importing it so the rest of
+# the module still runs where httpx is missing
+HAS_HTTPX = importlib.util.find_spec("httpx") is not None
+if HAS_HTTPX or TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+
+# NO_COLOR wins over FORCE_COLOR in CI, so rich renders help as plain text
+runner = CliRunner(env={"NO_COLOR": "1", "TERM": "dumb"})
 
 
 class TestDatabaseAbstraction:
     """Tests for the Database abstract base class and implementations."""
 
-    def test_sqlite_database_creation(self, tmp_path: Path) -> None:
+    def test_sqlite_database_creation(self, mem_db: SQLiteDatabase) -> None:
         """Test SQLiteDatabase can be created and initialized."""
-        db_path = tmp_path / "test.db"
+        # Verify schema was created
+        row = cast(
+            "sqlite3.Row | None",
+            mem_db.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='jobs'"
+            ).fetchone(),
+        )
+        assert row is not None
+
+    def test_wal_enabled(self, sqlite_db: SQLiteDatabase, tmp_path: Path) -> None:
+        """Test SQLiteDatabase connections use WAL and the tuning pragmas."""
+        journal = cast(
+            "sqlite3.Row", sqlite_db.conn.execute("PRAGMA journal_mode").fetchone()
+        )
+        assert journal[0] == "wal"
+        # The sqlite_db fixture opts into WHIRR_SQLITE_WAL=1
+        synchronous = cast(
+            "sqlite3.Row", sqlite_db.conn.execute("PRAGMA synchronous").fetchone()
+        )
+        assert synchronous[0] == 1  # NORMAL
+        busy_timeout = cast(
+            "sqlite3.Row", sqlite_db.conn.execute("PRAGMA busy_timeout").fetchone()
+        )
+        assert busy_timeout[0] == 5000
+        temp_store = cast(
+            "sqlite3.Row", sqlite_db.conn.execute("PRAGMA temp_store").fetchone()
+        )
+        assert temp_store[0] == 2  # MEMORY
+
+        # The last close checkpoints the WAL, so no sidecar files are left
+        sqlite_db.close()
+        assert not (tmp_path / "test.db-wal").exists()
+
+    def test_tuning_off_by_default(
+        self, db_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test connections only get WAL and the busy timeout without opt-in."""
+        monkeypatch.delenv("WHIRR_SQLITE_WAL", raising=False)
         db = SQLiteDatabase(db_path)
         try:
-            db.init_schema()
-            # Verify schema was created
-            row = cast(
-                "sqlite3.Row | None",
-                db.conn.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name='jobs'"
-                ).fetchone(),
-            )
-            assert row is not None
+            names = ("journal_mode", "busy_timeout", "synchronous", "temp_store")
+            pragmas = {
+                name: cast(
+                    "sqlite3.Row", db.conn.execute(f"PRAGMA {name}").fetchone()
+                )[0]
+                for name in names
+            }
         finally:
             db.close()
+        assert pragmas == {
+            "journal_mode": "wal",
+            "busy_timeout": 5000,
+            "synchronous": 2,  # FULL
+            "temp_store": 0,  # DEFAULT
+        }
+
+    def test_wal_skipped_in_memory(self, mem_db: SQLiteDatabase) -> None:
+        """Test in-memory databases keep their memory journal."""
+        journal = cast(
+            "sqlite3.Row", mem_db.conn.execute("PRAGMA journal_mode").fetchone()
+        )
+        assert journal[0] == "memory"
 
-    def test_sqlite_create_and_claim_job(self, tmp_path: Path) -> None:
+    def test_sqlite_create_and_claim_job(self, mem_db: SQLiteDatabase) -> None:
         """Test SQLiteDatabase job operations."""
-        db_path = tmp_path / "test.db"
-        db = SQLiteDatabase(db_path)
-        try:
-            db.init_schema()
-
-            # Create a job
-            job_id = db.create_job(
-                command_argv=["python", "test.py"],
-                workdir="/tmp",
-                name="test-job",
-                tags=["test"],
-            )
-            assert job_id == 1
-
-            # Claim the job
-            job: JobRecord | None = db.claim_job("worker-1")
-            assert job is not None
-            assert job.id == job_id
-            assert job.command_argv == ["python", "test.py"]
-            assert job.name == "test-job"
+        # Create a job
+        job_id = mem_db.create_job(
+            command_argv=["python", "test.py"],
+            workdir="/tmp",
+            name="test-job",
+            tags=["test"],
+        )
+        assert job_id == 1
 
-            # No more jobs to claim
-            job2 = db.claim_job("worker-2")
-            assert job2 is None
-        finally:
-            db.close()
+        # Claim the job
+        job: JobRecord | None = mem_db.claim_job("worker-1")
+        assert job is not None
+        assert job.id == job_id
+        assert job.command_argv == ["python", "test.py"]
+        assert job.name == "test-job"
+
+        # No more jobs to claim
+        job2 = mem_db.claim_job("worker-2")
+        assert job2 is None
+
+    def test_sqlite_create_jobs(self, mem_db: SQLiteDatabase) -> None:
+        """Test bulk job creation returns IDs in submission order."""
+        jobs = [
+            JobCreate(command_argv=["echo", str(i)], workdir="/tmp", name=f"j{i}")
+            for i in range(100)
+        ]
+        job_ids = mem_db.create_jobs(jobs)
+        assert job_ids == list(range(1, 101))
+
+        job = mem_db.get_job(job_ids[-1])
+        assert job is not None
+        assert job.name == "j99"
+        assert job.command_argv == ["echo", "99"]
+        assert mem_db.create_jobs([]) == []
 
-    def test_sqlite_complete_job(self, tmp_path: Path) -> None:
+    def test_sqlite_complete_job(self, mem_db: SQLiteDatabase) -> None:
         """Test SQLiteDatabase complete_job."""
-        db_path = tmp_path / "test.db"
-        db = SQLiteDatabase(db_path)
-        try:
-            db.init_schema()
+        job_id = mem_db.create_job(["echo", "hello"], "/tmp")
+        _ = mem_db.claim_job("worker-1")
+        mem_db.complete_job(job_id, exit_code=0)
 
-            job_id = db.create_job(["echo", "hello"], "/tmp")
-            _ = db.claim_job("worker-1")
-            db.complete_job(job_id, exit_code=0)
-
-            job = db.get_job(job_id)
-            assert job is not None
-            assert job.status == "completed"
-            assert job.exit_code == 0
-        finally:
-            db.close()
+        job = mem_db.get_job(job_id)
+        assert job is not None
+        assert job.status == "completed"
+        assert job.exit_code == 0
 
-    def test_sqlite_run_operations(self, tmp_path: Path) -> None:
+    def test_sqlite_run_operations(self, mem_db: SQLiteDatabase) -> None:
         """Test SQLiteDatabase run operations."""
-        db_path = tmp_path / "test.db"
-        db = SQLiteDatabase(db_path)
-        try:
-            db.init_schema()
-
-            # Create a run
-            db.create_run(
-                run_id="test-run-123",
-                run_dir="/tmp/runs/test-run-123",
-                name="Test Run",
-                config={"lr": 0.01},
-                tags=["test"],
-            )
+        # Create a run
+        mem_db.create_run(
+            run_id="test-run-123",
+            run_dir="/tmp/runs/test-run-123",
+            name="Test Run",
+            config={"lr": 0.01},
+            tags=["test"],
+        )
 
-            # Get the run
-            run: RunRecord | None = db.get_run("test-run-123")
-            assert run is not None
-            assert run.id == "test-run-123"
-            assert run.name == "Test Run"
-            assert run.status == "running"
-
-            # Complete the run
-            db.complete_run("test-run-123", "completed", {"final_loss": 0.1})
-            run = db.get_run("test-run-123")
-            assert run is not None
-            assert run.status == "completed"
-        finally:
-            db.close()
+        # Get the run
+        run: RunRecord | None = mem_db.get_run("test-run-123")
+        assert run is not None
+        assert run.id == "test-run-123"
+        assert run.name == "Test Run"
+        assert run.status == "running"
 
-    def test_sqlite_worker_operations(self, tmp_path: Path) -> None:
+        # Complete the run
+        mem_db.complete_run("test-run-123", "completed", {"final_loss": 0.1})
+        run = mem_db.get_run("test-run-123")
+        assert run is not None
+        assert run.status == "completed"
+
+    def test_sqlite_worker_operations(self, mem_db: SQLiteDatabase) -> None:
         """Test SQLiteDatabase worker operations."""
-        db_path = tmp_path / "test.db"
-        db = SQLiteDatabase(db_path)
-        try:
-            db.init_schema()
-
-            # Register a worker
-            db.register_worker(
-                worker_id="worker-1",
-                pid=1234,
-                hostname="test-host",
-                gpu_index=0,
-            )
+        # Register a worker
+        mem_db.register_worker(
+            worker_id="worker-1",
+            pid=1234,
+            hostname="test-host",
+            gpu_index=0,
+        )
 
-            # Get workers
-            workers: list[WorkerRecord] = db.get_workers()
-            assert len(workers) == 1
-            assert workers[0].id == "worker-1"
-            assert workers[0].hostname == "test-host"
-
-            # Update status
-            db.update_worker_status("worker-1", "busy", current_job_id=1)
-            workers = db.get_workers()
-            assert workers[0].status == "busy"
-
-            # Unregister
-            db.unregister_worker("worker-1")
-            workers = db.get_workers()
-            assert workers[0].status == "offline"
+        # Get workers
+        workers: list[WorkerRecord] = mem_db.get_workers()
+        assert len(workers) == 1
+        assert workers[0].id == "worker-1"
+        assert workers[0].hostname == "test-host"
+
+        # Update status
+        mem_db.update_worker_status("worker-1", "busy", current_job_id=1)
+        worker = mem_db.get_worker("worker-1")
+        assert worker is not None
+        assert worker.status == "busy"
+        assert worker.current_job_id == 1
+
+        # Unregister
+        mem_db.unregister_worker("worker-1")
+        worker = mem_db.get_worker("worker-1")
+        assert worker is not None
+        assert worker.status == "offline"
+        assert mem_db.get_worker("worker-2") is None
+
+    def test_sqlite_readers_do_not_wait_for_writer(
+        self, sqlite_db: SQLiteDatabase
+    ) -> None:
+        """Test reads from other threads proceed while a write is in flight."""
+        sqlite_db.register_worker(worker_id="worker-1", pid=1, hostname="test-host")
+
+        _ = sqlite_db.conn.execute("BEGIN IMMEDIATE")
+        try:
+            sqlite_db.update_worker_status("worker-1", "busy")
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [
+                    pool.submit(sqlite_db.get_worker, "worker-1") for _ in range(4)
+                ]
+                workers = [future.result(timeout=2.0) for future in futures]
         finally:
-            db.close()
+            _ = sqlite_db.conn.execute("ROLLBACK")
 
-    def test_get_database_factory_sqlite(self, tmp_path: Path) -> None:
+        # Each reader sees the last committed state, not the open write
+        assert [w.status for w in workers if w is not None] == ["idle"] * 4
+
+    def test_get_database_factory_sqlite(self) -> None:
         """Test get_database factory with SQLite."""
-        db_path = tmp_path / "test.db"
-        db = get_database(db_path=db_path)
+        db = get_database(db_path=Path(":memory:"))
         try:
             assert isinstance(db, SQLiteDatabase)
         finally:
@@ -185,88 +268,117 @@ class TestDatabaseAbstraction:
             _ = get_database()
 
 
+class _FakeClock:
+    """Stand-in for the time module where sleep() advances a virtual clock."""
+
+    now: float
+    sleeps: list[float]
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    """Replace whirr.client's time module so polling never really sleeps."""
+    clock = _FakeClock()
+    monkeypatch.setattr(client_module, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def whirr_client() -> Generator[WhirrClient, None, None]:
+    """Create a client for a server that is never contacted."""
+    with WhirrClient("http://localhost:9999") as client:
+        yield client
+
+
+def _stub_get_job(
+    monkeypatch: pytest.MonkeyPatch,
+    client: WhirrClient,
+    responses: Iterator[JobResponse | None],
+) -> None:
+    """Make client.get_job() return the next response on each call."""
+
+    def get_job(_job_id: int) -> JobResponse | None:
+        return next(responses)
+
+    monkeypatch.setattr(client, "get_job", get_job)
+
+
 class TestClientModule:
     """Tests for the HTTP client module."""
 
     def test_client_import(self) -> None:
         """Test client module can be imported."""
-        from whirr.client import WhirrClient, WhirrClientError, get_client
         assert WhirrClient is not None
         assert WhirrClientError is not None
-        assert get_client is not None
+        assert client_module.get_client is not None
 
-    def test_client_requires_httpx(self) -> None:
+    def test_client_requires_httpx(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test client raises helpful error without httpx."""
-        import importlib
-
-        import whirr.client as client_module
-
-        try:
-            with patch.dict("sys.modules", {"httpx": None}):
-                # Re-import to trigger ImportError
-                _ = importlib.reload(client_module)
-                with pytest.raises(ImportError, match="httpx is required"):
-                    _ = client_module.WhirrClient("http://localhost:8080")
-        finally:
-            # Reload module to restore normal state for other tests
-            _ = importlib.reload(client_module)
-
-    def test_client_wait_for_job_timeout(self) -> None:
+        # Same state the module's import guard leaves when httpx is missing
+        monkeypatch.setattr(client_module, "httpx", None)
+        with pytest.raises(ImportError, match="httpx is required"):
+            _ = client_module.WhirrClient("http://localhost:8080")
+
+    def test_client_wait_for_job_timeout(
+        self,
+        whirr_client: WhirrClient,
+        fake_clock: _FakeClock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test wait_for_job raises TimeoutError."""
-        from whirr.client import WhirrClient
-
-        client = WhirrClient("http://localhost:9999")
-        # Mock get_job to always return running status
-        client.get_job = MagicMock(return_value=JobResponse(id=1, command_argv=["echo", "test"], workdir="/tmp", status="running"))
+        # Stub get_job to always return running status
+        running = JobResponse(
+            id=1, command_argv=["echo", "test"], workdir="/tmp", status="running"
+        )
+        _stub_get_job(monkeypatch, whirr_client, itertools.repeat(running))
 
         with pytest.raises(TimeoutError, match="did not complete"):
-            _ = client.wait_for_job(1, poll_interval=0.01, timeout=0.05)
-
-    def test_client_wait_for_job_completes(self) -> None:
+            _ = whirr_client.wait_for_job(1, poll_interval=0.01, timeout=0.05)
+        assert fake_clock.now > 0.05
+        assert len(fake_clock.sleeps) == 6
+
+    def test_client_wait_for_job_completes(
+        self,
+        whirr_client: WhirrClient,
+        fake_clock: _FakeClock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test wait_for_job returns when job completes."""
-        from whirr.client import WhirrClient
-
-        client = WhirrClient("http://localhost:9999")
-        # Mock get_job to return completed after first call
-        call_count: list[int] = [0]
-        def mock_get_job(job_id: int) -> JobResponse:
-            call_count[0] += 1
-            if call_count[0] >= 2:
-                return JobResponse(
-                    id=job_id,
-                    command_argv=["echo", "test"],
-                    workdir="/tmp",
-                    status="completed",
-                    exit_code=0,
-                )
-            return JobResponse(
-                id=job_id,
-                command_argv=["echo", "test"],
-                workdir="/tmp",
-                status="running",
-            )
-
-        client.get_job = mock_get_job
+        # Stub get_job to report running once, then completed
+        running = JobResponse(
+            id=1, command_argv=["echo", "test"], workdir="/tmp", status="running"
+        )
+        completed = running.model_copy(update={"status": "completed", "exit_code": 0})
+        responses = iter([running, completed])
+        _stub_get_job(monkeypatch, whirr_client, responses)
 
-        result = client.wait_for_job(1, poll_interval=0.01)
+        result = whirr_client.wait_for_job(1, poll_interval=0.01)
         assert result.status == "completed"
-        assert call_count[0] == 2
+        assert next(responses, None) is None  # polled exactly twice
+        assert fake_clock.sleeps == [0.01]
 
-    def test_client_wait_for_job_not_found(self) -> None:
+    def test_client_wait_for_job_not_found(
+        self, whirr_client: WhirrClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test wait_for_job raises error if job not found."""
-        from whirr.client import WhirrClient, WhirrClientError
-
-        client = WhirrClient("http://localhost:9999")
-        client.get_job = MagicMock(return_value=None)
+        _stub_get_job(monkeypatch, whirr_client, itertools.repeat(None))
 
         with pytest.raises(WhirrClientError, match="not found"):
-            _ = client.wait_for_job(999, poll_interval=0.01)
+            _ = whirr_client.wait_for_job(999, poll_interval=0.01)
 
-    def test_client_get_metrics(self) -> None:
+    def test_client_get_metrics(self, whirr_client: WhirrClient) -> None:
         """Test get_metrics method."""
-        from whirr.client import WhirrClient
-
-        client = WhirrClient("http://localhost:9999")
         request_mock = MagicMock(
             return_value=RunMetricsResponse(
                 metrics=[
@@ -276,8 +388,8 @@ class TestClientModule:
                 count=2,
             )
         )
-        with patch.object(client, "_request", request_mock):
-            metrics = client.get_metrics("test-run")
+        with patch.object(whirr_client, "_request", request_mock):
+            metrics = whirr_client.get_metrics("test-run")
             assert len(metrics) == 2
             record = metrics[0].model_dump()
             assert record["loss"] == 1.0
@@ -287,11 +399,8 @@ class TestClientModule:
                 response_model=RunMetricsResponse,
             )
 
-    def test_client_list_artifacts(self) -> None:
+    def test_client_list_artifacts(self, whirr_client: WhirrClient) -> None:
         """Test list_artifacts method."""
-        from whirr.client import WhirrClient
-
-        client = WhirrClient("http://localhost:9999")
         request_mock = MagicMock(
             return_value=RunArtifactsResponse(
                 artifacts=[
@@ -309,8 +418,8 @@ class TestClientModule:
                 count=2,
             )
         )
-        with patch.object(client, "_request", request_mock):
-            artifacts = client.list_artifacts("test-run")
+        with patch.object(whirr_client, "_request", request_mock):
+            artifacts = whirr_client.list_artifacts("test-run")
             assert len(artifacts) == 2
             assert artifacts[0].path == "metrics.jsonl"
             request_mock.assert_called_with(
@@ -319,82 +428,148 @@ class TestClientModule:
                 response_model=RunArtifactsResponse,
             )
 
-    def test_client_get_artifact(self) -> None:
+    def test_client_get_artifact(self, whirr_client: WhirrClient) -> None:
         """Test get_artifact method."""
-        from whirr.client import WhirrClient
-
-        client = WhirrClient("http://localhost:9999")
-
-        # Mock the httpx client's get method
-        mock_response = MagicMock()
-        mock_response.content = b"file content here"
-        mock_response.raise_for_status = MagicMock()
-        client_httpx = MagicMock()
-        get_mock = MagicMock(return_value=mock_response)
-        client_httpx.get = get_mock
-        with patch.object(client, "_client", client_httpx):
-            content = client.get_artifact("test-run", "output.log")
+        # Stub the httpx client's get method; only its call args are asserted
+        response = SimpleNamespace(
+            content=b"file content here", raise_for_status=lambda: None
+        )
+        get_mock = MagicMock(return_value=response)
+        with patch.object(whirr_client, "_client", SimpleNamespace(get=get_mock)):
+            content = whirr_client.get_artifact("test-run", "output.log")
             assert content == b"file content here"
             get_mock.assert_called_with(
                 "http://localhost:9999/api/v1/runs/test-run/artifacts/output.log"
             )
 
 
+@pytest.fixture(scope="module")
+def app_instance(tmp_path_factory: pytest.TempPathFactory) -> FastAPI:
+    """Build one SQLite-backed app for the tests that only inspect it."""
+    return create_app(db_path=tmp_path_factory.mktemp("app") / "test.db")
+
+
+@pytest.fixture(scope="module")
+def app_routes(app_instance: FastAPI) -> frozenset[str]:
+    """Collect the app's route paths once."""
+    return frozenset(
+        cast("str", getattr(route, "path", "")) for route in app_instance.routes
+    )
+
+
 class TestServerModule:
     """Tests for the server module."""
 
     def test_server_imports(self) -> None:
         """Test server module can be imported."""
-        from whirr.server import create_app
-        from whirr.server.models import (
-            JobClaim,
-        )
-        assert create_app is not None
-        assert JobClaim is not None
+        import whirr.server as server_module
 
-    def test_create_app_with_sqlite(self, tmp_path: Path) -> None:
-        """Test create_app with SQLite database."""
-        from whirr.server.app import create_app
+        assert server_module.create_app is create_app
+        assert server_module.JobClaim is JobClaim
 
-        db_path = tmp_path / "test.db"
-        app = create_app(db_path=db_path)
-        assert app is not None
-        assert app.title == "whirr server"
+    def test_create_app_with_sqlite(self, app_instance: FastAPI) -> None:
+        """Test create_app with SQLite database."""
+        assert app_instance.title == "whirr server"
 
-    def test_server_routes_exist(self, tmp_path: Path) -> None:
+    def test_server_routes_exist(self, app_routes: frozenset[str]) -> None:
         """Test server has expected routes."""
-        from whirr.server.app import create_app
+        expected = {
+            "/api/v1/workers/register",
+            "/api/v1/jobs/claim",
+            "/api/v1/jobs",
+            "/api/v1/runs",
+            "/api/v1/status",
+            "/health",
+        }
+        # Empty difference reads better than a bare subset check on failure
+        assert expected - app_routes == set()
+
+
+def _seed_job(
+    db: SQLiteDatabase,
+    *,
+    status: str = "queued",
+    worker_id: str | None = None,
+) -> int:
+    """Insert a job in a given state with one statement, bypassing the API."""
+    row = cast(
+        "sqlite3.Row",
+        db.conn.execute(
+            """
+            INSERT INTO jobs (command_argv, workdir, status, worker_id, started_at)
+            VALUES ('["echo", "test"]', '/tmp', ?, ?, ?)
+            RETURNING id
+            """,
+            (status, worker_id, utcnow() if worker_id else None),
+        ).fetchone(),
+    )
+    return cast("int", row[0])
+
+
+def _seed_jobs(db: SQLiteDatabase, n: int, *, status: str = "queued") -> None:
+    """Insert n jobs in a given state with one prepared statement."""
+    with db.conn:
+        _ = db.conn.executemany(
+            """
+            INSERT INTO jobs (command_argv, workdir, name, status)
+            VALUES (?, '/tmp', ?, ?)
+            """,
+            [(json.dumps(["echo", str(i)]), f"job-{i}", status) for i in range(n)],
+        )
 
-        db_path = tmp_path / "test.db"
-        app = create_app(db_path=db_path)
 
-        routes = [cast("str", getattr(route, "path", "")) for route in app.routes]
+@pytest.fixture(scope="module")
+def server_db(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[SQLiteDatabase, None, None]:
+    """Open the database shared by every server API test."""
+    db = SQLiteDatabase(tmp_path_factory.mktemp("server") / "test.db")
+    yield db
+    db.close()
 
-        # Check key routes exist
-        assert "/api/v1/workers/register" in routes
-        assert "/api/v1/jobs/claim" in routes
-        assert "/api/v1/jobs" in routes
-        assert "/api/v1/runs" in routes
-        assert "/api/v1/status" in routes
-        assert "/health" in routes
 
+@pytest.fixture(scope="module")
+def client(server_db: SQLiteDatabase) -> Generator[TestClient, None, None]:
+    """Create a test client shared by every server API test.
 
-# Check if httpx is available for TestClient
-HAS_HTTPX = importlib.util.find_spec("httpx") is not None
+    Entering the client keeps one event-loop portal open for the whole
+    module instead of starting a new one per request.
+    """
+    app = create_app(db_path=Path(server_db.db_path))
+    # Pin the app to server_db; other tests' create_app() calls swap the
+    # server's global database
+    app.dependency_overrides[get_db] = lambda: server_db
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def artifact_run_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the run directory the read-only artifact tests share."""
+    run_dir = tmp_path_factory.mktemp("runs") / "test-artifacts"
+    (run_dir / "artifacts").mkdir(parents=True)
+    _ = (run_dir / "metrics.jsonl").write_text('{"loss": 0.5}\n')
+    _ = (run_dir / "output.log").write_text("some output\n")
+    _ = (run_dir / "artifacts" / "model.pt").write_bytes(b"model data")
+    return run_dir
 
 
 @pytest.mark.skipif(not HAS_HTTPX, reason="httpx not installed")
 class TestServerAPI:
     """Tests for server API endpoints using TestClient."""
 
-    @pytest.fixture
-    def client(self, tmp_path: Path) -> TestClient:
-        """Create a test client."""
-        from whirr.server.app import create_app
-
-        db_path = tmp_path / "test.db"
-        app = create_app(db_path=db_path)
-        return TestClient(app)
+    @pytest.fixture(autouse=True)
+    def _reset_db(self, server_db: SQLiteDatabase) -> Generator[None, None, None]:
+        """Empty the shared database after each test, restarting IDs at 1."""
+        yield
+        _ = server_db.conn.executescript(
+            """
+            DELETE FROM jobs;
+            DELETE FROM runs;
+            DELETE FROM workers;
+            DELETE FROM sqlite_sequence;
+            """
+        )
 
     def test_health_check(self, client: TestClient) -> None:
         """Test health check endpoint."""
@@ -460,20 +635,10 @@ class TestServerAPI:
         claim = JobClaimResponse.model_validate_json(response.text)
         assert claim.job is None
 
-    def test_complete_job(self, client: TestClient) -> None:
+    def test_complete_job(self, client: TestClient, server_db: SQLiteDatabase) -> None:
         """Test job completion."""
-        # Create and claim a job
-        _ = client.post(
-            "/api/v1/jobs",
-            json={"command_argv": ["echo", "test"], "workdir": "/tmp"},
-        )
-        claim = client.post(
-            "/api/v1/jobs/claim",
-            json={"worker_id": "test-worker", "lease_seconds": 60},
-        )
-        claim_payload = JobClaimResponse.model_validate_json(claim.text)
-        assert claim_payload.job is not None
-        job_id = claim_payload.job.id
+        # Seed a job already claimed by the worker
+        job_id = _seed_job(server_db, status="running", worker_id="test-worker")
 
         # Complete the job
         response = client.post(
@@ -487,23 +652,24 @@ class TestServerAPI:
         payload = MessageResponse.model_validate_json(response.text)
         assert "completed" in payload.message
 
-    def test_get_status(self, client: TestClient) -> None:
+    def test_get_status(self, client: TestClient, server_db: SQLiteDatabase) -> None:
         """Test status endpoint."""
+        _seed_jobs(server_db, 3)
+        _seed_jobs(server_db, 2, status="running")
+
         response = client.get("/api/v1/status")
         assert response.status_code == 200
         payload = StatusResponse.model_validate_json(response.text)
-        assert payload.queued >= 0
-        assert payload.running >= 0
-        assert payload.workers_online >= 0
+        assert payload.queued == 3
+        assert payload.running == 2
+        assert payload.workers_online == 0
 
-    def test_get_run_metrics(self, client: TestClient, tmp_path: Path) -> None:
+    def test_get_run_metrics(
+        self, client: TestClient, server_db: SQLiteDatabase, tmp_path: Path
+    ) -> None:
         """Test get run metrics endpoint."""
-        import json
-
         # Create a run in the database
-        from whirr.server.app import get_db
-        db = get_db()
-        db.create_run(
+        server_db.create_run(
             run_id="test-run-metrics",
             run_dir=str(tmp_path / "runs" / "test-run-metrics"),
             name="Test Run",
@@ -513,16 +679,12 @@ class TestServerAPI:
         run_dir = tmp_path / "runs" / "test-run-metrics"
         run_dir.mkdir(parents=True)
         metrics_file = run_dir / "metrics.jsonl"
-        _ = metrics_file.write_text(
-            "\n".join(
-                [
-                    json.dumps({"step": 0, "loss": 1.0}),
-                    json.dumps({"step": 1, "loss": 0.5}),
-                    json.dumps({"step": 2, "loss": 0.25}),
-                ]
-            )
-            + "\n"
-        )
+        lines = [
+            '{"step": 0, "loss": 1.0}',
+            '{"step": 1, "loss": 0.5}',
+            '{"step": 2, "loss": 0.25}',
+        ]
+        _ = metrics_file.write_text("\n".join(lines) + "\n")
 
         # Get metrics via API
         response = client.get("/api/v1/runs/test-run-metrics/metrics")
@@ -535,16 +697,25 @@ class TestServerAPI:
         assert metric_first["loss"] == 1.0
         assert metric_last["loss"] == 0.25
 
-    def test_get_run_metrics_not_found(self, client: TestClient) -> None:
-        """Test get metrics for non-existent run."""
-        response = client.get("/api/v1/runs/nonexistent/metrics")
+    @pytest.mark.parametrize(
+        "endpoint",
+        [
+            "/api/v1/runs/nonexistent",
+            "/api/v1/runs/nonexistent/metrics",
+            "/api/v1/runs/nonexistent/artifacts",
+            "/api/v1/runs/nonexistent/artifacts/output.log",
+        ],
+    )
+    def test_run_endpoints_not_found(self, client: TestClient, endpoint: str) -> None:
+        """Test run endpoints return 404 for a non-existent run."""
+        response = client.get(endpoint)
         assert response.status_code == 404
 
-    def test_get_run_metrics_no_file(self, client: TestClient, tmp_path: Path) -> None:
+    def test_get_run_metrics_no_file(
+        self, client: TestClient, server_db: SQLiteDatabase, tmp_path: Path
+    ) -> None:
         """Test get metrics when no metrics file exists."""
-        from whirr.server.app import get_db
-        db = get_db()
-        db.create_run(
+        server_db.create_run(
             run_id="test-run-no-metrics",
             run_dir=str(tmp_path / "runs" / "test-run-no-metrics"),
             name="Test Run",
@@ -570,23 +741,34 @@ class TestServerAPI:
         payload = JobCreateResponse.model_validate_json(response.text)
         assert payload.run_id == f"job-{payload.job_id}"
 
-    def test_list_artifacts(self, client: TestClient, tmp_path: Path) -> None:
-        """Test list artifacts endpoint."""
-        from whirr.server.app import get_db
+    def test_create_jobs_bulk(
+        self, client: TestClient, server_db: SQLiteDatabase
+    ) -> None:
+        """Test bulk job creation endpoint."""
+        response = client.post(
+            "/api/v1/jobs/bulk",
+            json={
+                "jobs": [
+                    {"command_argv": ["echo", str(i)], "workdir": "/tmp"}
+                    for i in range(3)
+                ]
+            },
+        )
+        assert response.status_code == 200
+        payload = JobBulkCreateResponse.model_validate_json(response.text)
+        assert payload.job_ids == [1, 2, 3]
 
-        # Create a run with some files
-        run_dir = tmp_path / "runs" / "test-artifacts"
-        run_dir.mkdir(parents=True)
-        _ = (run_dir / "metrics.jsonl").write_text('{"loss": 0.5}\n')
-        _ = (run_dir / "output.log").write_text("some output\n")
-        artifacts_dir = run_dir / "artifacts"
-        artifacts_dir.mkdir()
-        _ = (artifacts_dir / "model.pt").write_bytes(b"model data")
-
-        db = get_db()
-        db.create_run(
+        job = server_db.get_job(3)
+        assert job is not None
+        assert job.command_argv == ["echo", "2"]
+
+    def test_list_artifacts(
+        self, client: TestClient, server_db: SQLiteDatabase, artifact_run_dir: Path
+    ) -> None:
+        """Test list artifacts endpoint."""
+        server_db.create_run(
             run_id="test-artifacts",
-            run_dir=str(run_dir),
+            run_dir=str(artifact_run_dir),
             name="Test Run",
         )
 
@@ -600,139 +782,112 @@ class TestServerAPI:
         assert "output.log" in paths
         assert "artifacts/model.pt" in paths
 
-    def test_list_artifacts_not_found(self, client: TestClient) -> None:
-        """Test list artifacts for non-existent run."""
-        response = client.get("/api/v1/runs/nonexistent/artifacts")
-        assert response.status_code == 404
-
-    def test_get_artifact(self, client: TestClient, tmp_path: Path) -> None:
+    def test_get_artifact(
+        self, client: TestClient, server_db: SQLiteDatabase, artifact_run_dir: Path
+    ) -> None:
         """Test get artifact endpoint."""
-        from whirr.server.app import get_db
-
-        # Create a run with a file
-        run_dir = tmp_path / "runs" / "test-get-artifact"
-        run_dir.mkdir(parents=True)
-        _ = (run_dir / "output.log").write_text("hello world\n")
-
-        db = get_db()
-        db.create_run(
-            run_id="test-get-artifact",
-            run_dir=str(run_dir),
+        server_db.create_run(
+            run_id="test-artifacts",
+            run_dir=str(artifact_run_dir),
             name="Test Run",
         )
 
-        response = client.get("/api/v1/runs/test-get-artifact/artifacts/output.log")
+        response = client.get("/api/v1/runs/test-artifacts/artifacts/output.log")
         assert response.status_code == 200
-        assert response.content == b"hello world\n"
-
-    def test_get_artifact_not_found(self, client: TestClient, tmp_path: Path) -> None:
-        """Test get artifact that doesn't exist."""
-        from whirr.server.app import get_db
-
-        run_dir = tmp_path / "runs" / "test-artifact-missing"
-        run_dir.mkdir(parents=True)
-
-        db = get_db()
-        db.create_run(
-            run_id="test-artifact-missing",
-            run_dir=str(run_dir),
-            name="Test Run",
-        )
-
-        response = client.get("/api/v1/runs/test-artifact-missing/artifacts/missing.txt")
-        assert response.status_code == 404
-
-    def test_get_artifact_path_traversal(self, client: TestClient, tmp_path: Path) -> None:
-        """Test get artifact blocks path traversal."""
-        from whirr.server.app import get_db
-
-        run_dir = tmp_path / "runs" / "test-traversal"
-        run_dir.mkdir(parents=True)
-
-        db = get_db()
-        db.create_run(
-            run_id="test-traversal",
-            run_dir=str(run_dir),
+        assert response.content == b"some output\n"
+
+    @pytest.mark.parametrize(
+        ("artifact_path", "expected_status"),
+        [
+            ("missing.txt", 404),
+            # Percent-encoded dots (%2e) bypass URL normalization that would
+            # otherwise collapse the path before reaching the server
+            ("%2e%2e/%2e%2e/%2e%2e/etc/passwd", 403),
+        ],
+        ids=["missing", "path-traversal"],
+    )
+    def test_get_artifact_rejected(
+        self,
+        client: TestClient,
+        server_db: SQLiteDatabase,
+        artifact_run_dir: Path,
+        artifact_path: str,
+        expected_status: int,
+    ) -> None:
+        """Test get artifact for missing files and path traversal."""
+        server_db.create_run(
+            run_id="test-artifacts",
+            run_dir=str(artifact_run_dir),
             name="Test Run",
         )
 
-        # Use percent-encoded dots (%2e) to bypass URL normalization
-        # that would otherwise collapse the path before reaching the server
-        response = client.get("/api/v1/runs/test-traversal/artifacts/%2e%2e/%2e%2e/%2e%2e/etc/passwd")
-        assert response.status_code == 403
-
-
-class TestServerCLI:
-    """Tests for server CLI command."""
-
-    def test_server_help(self) -> None:
-        """Test server command shows help."""
-        from typer.testing import CliRunner
-
-        from whirr.cli.main import app
-
-        runner = CliRunner()
-        result = runner.invoke(app, ["server", "--help"])
-        assert result.exit_code == 0
-        assert "Start the whirr server" in result.output
+        response = client.get(f"/api/v1/runs/test-artifacts/artifacts/{artifact_path}")
+        assert response.status_code == expected_status
 
 
-class TestWorkerRemoteMode:
-    """Tests for worker remote mode."""
-
-    def test_worker_help_shows_server_option(self) -> None:
-        """Test worker help shows --server option."""
-        from typer.testing import CliRunner
-
-        from whirr.cli.main import app
-
-        runner = CliRunner()
-        result = runner.invoke(app, ["worker", "--help"])
+@pytest.fixture(scope="module")
+def help_outputs() -> dict[str, str]:
+    """Render --help once per command for the whole module."""
+    outputs: dict[str, str] = {}
+    for cmd in ("server", "worker", "submit"):
+        result = runner.invoke(cli_app, [cmd, "--help"])
         assert result.exit_code == 0
-        output = strip_ansi(result.output)
-        assert "--server" in output
-        assert "--data-dir" in output
-
-
-class TestSubmitRemoteMode:
-    """Tests for submit remote mode."""
+        assert "\x1b" not in result.output
+        outputs[cmd] = result.output
+    return outputs
 
-    def test_submit_help_shows_server_option(self) -> None:
-        """Test submit help shows --server option."""
-        from typer.testing import CliRunner
 
-        from whirr.cli.main import app
-
-        runner = CliRunner()
-        result = runner.invoke(app, ["submit", "--help"])
-        assert result.exit_code == 0
-        output = strip_ansi(result.output)
-        assert "--server" in output
+class TestServerCLI:
+    """Tests for server-mode CLI options."""
+
+    @pytest.mark.parametrize(
+        ("cmd", "needle"),
+        [
+            ("server", "Start the whirr server"),
+            ("worker", "--server"),
+            ("worker", "--data-dir"),
+            ("submit", "--server"),
+        ],
+    )
+    def test_help_mentions(
+        self, help_outputs: dict[str, str], cmd: str, needle: str
+    ) -> None:
+        """Test server-mode commands and options appear in --help."""
+        assert needle in help_outputs[cmd]
 
 
 class TestModels:
     """Tests for Pydantic models."""
 
-    def test_job_claim_validation(self) -> None:
-        """Test JobClaim model validation."""
-        from whirr.server.models import JobClaim
-
-        # Valid claim
+    def test_job_claim_valid(self) -> None:
+        """Test JobClaim accepts a lease within bounds."""
         claim = JobClaim(worker_id="test", lease_seconds=60)
         assert claim.worker_id == "test"
 
-        # Lease too short
-        with pytest.raises(ValueError, match="lease_seconds"):
-            _ = JobClaim(worker_id="test", lease_seconds=5)
-
-        # Lease too long
+    @pytest.mark.parametrize(
+        "lease", [pytest.param(5, id="too-short"), pytest.param(1000, id="too-long")]
+    )
+    def test_job_claim_invalid_lease(self, lease: int) -> None:
+        """Test JobClaim rejects an out-of-bounds lease."""
         with pytest.raises(ValueError, match="lease_seconds"):
-            _ = JobClaim(worker_id="test", lease_seconds=1000)
+            _ = JobClaim(worker_id="test", lease_seconds=lease)
+
+    def test_api_models_built_at_import(self) -> None:
+        """Test API models have no deferred schema build left for first use."""
+        import whirr.models.api as api_models
+
+        namespace = cast("Mapping[str, object]", vars(api_models))
+        incomplete = [
+            name
+            for name, model in namespace.items()
+            if isinstance(model, type)
+            and issubclass(model, BaseModel)
+            and not model.__pydantic_complete__
+        ]
+        assert incomplete == []
 
     def test_job_create_required_fields(self) -> None:
         """Test JobCreate model required fields."""
-        from whirr.server.models import JobCreate
-
         job = JobCreate(
             command_argv=["python", "test.py"],
             workdir="/tmp",
@@ -744,22 +899,11 @@ class TestModels:
 class TestBackwardCompatibility:
     """Tests to ensure backward compatibility with v0.3 code."""
 
-    def test_legacy_db_functions_work(self, tmp_path: Path) -> None:
+    def test_legacy_db_functions_work(self) -> None:
         """Test that legacy DB functions still work."""
-        from whirr.db import (
-            claim_job,
-            complete_job,
-            create_job,
-            get_connection,
-            get_job,
-            init_db,
-        )
-
-        db_path = tmp_path / "test.db"
-        init_db(db_path)
-
-        conn = get_connection(db_path)
+        conn = get_connection(Path(":memory:"))
         try:
+            _ = conn.executescript(SCHEMA)
             job_id = create_job(conn, ["echo", "hello"], "/tmp", name="test")
             assert job_id == 1
 
@@ -774,5 +918,4 @@ class TestBackwardCompatibility:
 
     def test_schema_alias(self) -> None:
         """Test SCHEMA alias for backward compatibility."""
-        from whirr.db import SCHEMA
         assert SCHEMA == SQLITE_SCHEMA